@@ -172,6 +172,12 @@ DATABASES = {
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 DATABASES["default"]["CONN_MAX_AGE"] = config("CONN_MAX_AGE", default=60, cast=int)
 
+# Covering indexes (INCLUDE columns) only exist on PostgreSQL. SQLite, used in
+# local development, builds them as plain indexes, so the check warning about
+# it is silenced for SQLite only.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    SILENCED_SYSTEM_CHECKS = ["models.W040"]
+
 
 # UPDATED: Storage configuration
 STORAGES = {
@@ -265,6 +271,12 @@ STATIC_ROOT = config("STATIC_ROOT", default=str(BASE_DIR / "staticfiles"))
 MEDIA_URL = config("MEDIA_URL", default="/media/")
 MEDIA_ROOT = config("MEDIA_ROOT", default=str(BASE_DIR / "media"))
 
+# Uploads above this size are spooled to a temporary file instead of being
+# held in memory (e.g. poll images, up to 10 per request)
+FILE_UPLOAD_MAX_MEMORY_SIZE = config(
+    "FILE_UPLOAD_MAX_MEMORY_SIZE", default=256 * 1024, cast=int
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -389,6 +401,18 @@ setup_logging()
 
 
 USE_ASYNC_NOTIFICATIONS = config("USE_ASYNC_NOTIFICATIONS", default=False, cast=bool)
+USE_ASYNC_POLL_TASKS = config("USE_ASYNC_POLL_TASKS", default=False, cast=bool)
+
+# Content moderation for new polls (when disabled, polls are published directly).
+# Moderation runs in moderate_poll_task, so it needs a Celery worker.
+POLL_MODERATION_ENABLED = config("POLL_MODERATION_ENABLED", default=False, cast=bool)
+ANTHROPIC_API_KEY = config("ANTHROPIC_API_KEY", default="")
+# Comma separated terms that get a poll rejected without calling the model
+MODERATION_BANNED_TERMS = config(
+    "MODERATION_BANNED_TERMS",
+    default="",
+    cast=lambda v: [s.strip().lower() for s in v.split(",") if s.strip()],
+)
 
 # Test logging configuration (only in development)
 if DEBUG:
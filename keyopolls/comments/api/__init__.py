@@ -141,8 +141,9 @@ def create_comment(
             # === ALWAYS INCREMENT MAIN CONTENT COMMENT COUNT ===
             # Increment comment count on main content object for ALL comments
             # (direct + replies)
-            content_obj.comment_count = F("comment_count") + 1
-            content_obj.save(update_fields=["comment_count"])
+            content_obj.__class__.objects.filter(id=content_obj.id).update(
+                comment_count=F("comment_count") + 1
+            )
 
             # NEW: Increment user's comment aura by 1 point for successful
             #  comment creation
@@ -365,8 +366,9 @@ def delete_comment(request: HttpRequest, comment_id: int):
         content_obj = comment.content_object
 
         if hasattr(content_obj, "comment_count"):
-            content_obj.comment_count = F("comment_count") - 1
-            content_obj.save(update_fields=["comment_count"])
+            content_obj.__class__.objects.filter(id=content_obj.id).update(
+                comment_count=F("comment_count") - 1
+            )
 
         return 200, {
             "comment_id": comment.id,
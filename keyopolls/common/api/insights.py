@@ -10,7 +10,7 @@ from django.utils import timezone
 from ninja import Router, Schema
 
 from keyopolls.common.models import Impression
-from keyopolls.polls.models import Poll, PollVote
+from keyopolls.polls.models import Poll, PollOption, PollVote
 from keyopolls.profile.middleware import PseudonymousJWTAuth
 from keyopolls.profile.models import PseudonymousProfile
 
@@ -342,7 +342,7 @@ def get_poll_voting_insights(request, poll_id: int):
             "text": option.text,
             "order": option.order,
             "vote_count": option.vote_count,
-            "percentage": option.vote_percentage,
+            "percentage": PollOption.pct(option.vote_count, poll.total_votes),
             "has_image": bool(option.image),
         }
         options_data.append(option_data)
@@ -204,9 +204,11 @@ class Reaction(models.Model):
                 setattr(content_obj, counter_field, reaction_counts[reaction_type])
                 updated_fields.append(counter_field)
 
-        # Save only if we have fields to update
+        # Write only the counters, without going through save()
         if updated_fields:
-            content_obj.save(update_fields=updated_fields)
+            content_obj.__class__.objects.filter(id=content_obj.id).update(
+                **{field: getattr(content_obj, field) for field in updated_fields}
+            )
 
     @classmethod
     def get_user_reactions(cls, profile, content_obj):
@@ -371,8 +373,9 @@ class Share(models.Model):
             if created:
                 # Increment the share count on the content object
                 if hasattr(content_object, "share_count"):
-                    content_object.share_count = models.F("share_count") + 1
-                    content_object.save(update_fields=["share_count"])
+                    content_object.__class__.objects.filter(
+                        id=content_object.id
+                    ).update(share_count=models.F("share_count") + 1)
                     # Refresh to get the actual value
                     content_object.refresh_from_db(fields=["share_count"])
 
@@ -2,6 +2,7 @@ import logging
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import F
 from django.http import HttpRequest
 from django.utils.text import slugify
 from ninja import File, Router, UploadedFile
@@ -257,8 +258,7 @@ def _handle_public_community_membership(profile, community, action: str):
             if action == "join":
                 if created:
                     # New membership created
-                    community.member_count += 1
-                    community.save(update_fields=["member_count"])
+                    _change_member_count(community, 1)
 
                     return 200, {
                         "success": True,
@@ -271,8 +271,7 @@ def _handle_public_community_membership(profile, community, action: str):
                     membership.status = "active"
                     membership.save(update_fields=["status", "updated_at"])
 
-                    community.member_count += 1
-                    community.save(update_fields=["member_count"])
+                    _change_member_count(community, 1)
 
                     return 200, {
                         "success": True,
@@ -294,8 +293,7 @@ def _handle_public_community_membership(profile, community, action: str):
                     membership.status = "left"
                     membership.save(update_fields=["status", "updated_at"])
 
-                    community.member_count = max(0, community.member_count - 1)
-                    community.save(update_fields=["member_count"])
+                    _change_member_count(community, -1)
 
                     return 200, {
                         "success": True,
@@ -310,3 +308,17 @@ def _handle_public_community_membership(profile, community, action: str):
     except Exception as e:
         logger.error(f"Error toggling community membership: {str(e)}")
         return 400, {"message": "An error occurred while processing your request"}
+
+
+def _change_member_count(community, delta: int) -> None:
+    """
+    Apply a member count change with a single F() UPDATE, so concurrent
+    joins/leaves don't overwrite each other, and mirror it on the instance
+    for the response.
+    """
+    communities = Community.objects.filter(pk=community.pk)
+    if delta < 0:
+        # Never drop below zero
+        communities = communities.filter(member_count__gte=-delta)
+    communities.update(member_count=F("member_count") + delta)
+    community.member_count = max(0, community.member_count + delta)
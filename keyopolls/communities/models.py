@@ -1,5 +1,9 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -112,6 +116,20 @@ class Community(models.Model):
             return False
         return True
 
+    def can_user_access(self, profile):
+        """
+        Check if profile can view this community's content. The result is
+        cached on the instance, so repeated checks in a request don't repeat
+        the membership query.
+        """
+        access_cache = self.__dict__.setdefault("_user_access_cache", {})
+        if profile.id not in access_cache:
+            access_cache[profile.id] = self.is_active and (
+                self.community_type == "public"
+                or self.memberships.filter(profile=profile, status="active").exists()
+            )
+        return access_cache[profile.id]
+
     def can_post(self, profile):
         """Check if profile can post in this community"""
         if not self.is_active:
@@ -186,3 +204,40 @@ class CommunityMembership(models.Model):
     def can_moderate(self):
         """Check if member can moderate"""
         return self.role in ["moderator", "admin", "creator"] and self.is_active_member
+
+    @staticmethod
+    def _active_cache_key(community_id, profile_id) -> str:
+        """Cache key for whether a profile is an active member of a community"""
+        return f"membership_active:{community_id}:{profile_id}"
+
+    @classmethod
+    def is_active_member_cached(cls, community_id, profile_id):
+        """
+        Check for an active membership, caching the answer briefly since it
+        sits on the voting path. Saves and deletes drop the cached value.
+
+        Only the shared Redis cache is used: a per-process cache can't be
+        invalidated across workers, so a banned member could keep voting.
+        """
+        membership = cls.objects.filter(
+            community_id=community_id, profile_id=profile_id, status="active"
+        )
+        if not settings.USE_REDIS:
+            return membership.exists()
+
+        key = cls._active_cache_key(community_id, profile_id)
+        active = cache.get(key)
+        if active is None:
+            active = membership.exists()
+            cache.set(key, active, 60)  # 1 minute
+        return active
+
+
+@receiver(post_save, sender=CommunityMembership)
+@receiver(post_delete, sender=CommunityMembership)
+def _clear_membership_cache(sender, instance, **kwargs):
+    """Drop the cached membership check once the change is committed"""
+    key = CommunityMembership._active_cache_key(
+        instance.community_id, instance.profile_id
+    )
+    transaction.on_commit(lambda: cache.delete(key))
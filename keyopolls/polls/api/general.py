@@ -2,7 +2,7 @@ import logging
 from typing import List, Optional
 
 from django.core.paginator import Paginator
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
 from django.http import HttpRequest
 from ninja import Query, Router
 
@@ -10,7 +10,14 @@ from keyopolls.common.models import Category, TaggedItem
 from keyopolls.common.models.impressions import record_list_impressions
 from keyopolls.common.schemas import Message
 from keyopolls.communities.models import Community, CommunityMembership
-from keyopolls.polls.models import Poll, PollTextAggregate, PollTextResponse, PollVote
+from keyopolls.polls.models import (
+    Poll,
+    PollAnswerResult,
+    PollOption,
+    PollTextAggregate,
+    PollTextResponse,
+    PollVote,
+)
 from keyopolls.polls.schemas import CastVoteSchema, PollDetails, PollListResponseSchema
 from keyopolls.polls.services import validate_vote_for_poll_type
 
@@ -23,6 +30,12 @@ from keyopolls.profile.middleware import (
 from keyopolls.profile.models import PseudonymousProfile
 
 logger = logging.getLogger(__name__)
+
+# Poll counters updated by casting a vote
+VOTE_COUNTER_FIELDS = ["total_votes", "total_voters", "correct_voter_count"]
+
+# Wide author and community columns the poll feed never serializes
+FEED_DEFERRED_FIELDS = ["community__description", "community__rules", "profile__about"]
 router = Router(tags=["Polls"])
 
 
@@ -68,30 +81,6 @@ def cast_vote(request, data: CastVoteSchema):
                 ),
             }
 
-        # Check if user has already voted/responded
-        if poll.poll_type == "text_input":
-            existing_response = poll.text_responses.filter(profile=profile).first()
-            if existing_response:
-                return 400, {
-                    "message": (
-                        (
-                            "You have already responded to this poll "
-                            "and cannot change your response"
-                        )
-                    ),
-                }
-        else:
-            existing_votes = poll.votes.filter(profile=profile)
-            if existing_votes.exists():
-                return 400, {
-                    "message": (
-                        (
-                            "You have already voted on this poll "
-                            "and cannot change your vote"
-                        )
-                    ),
-                }
-
         # Handle text input polls
         if poll.poll_type == "text_input":
             if not data.text_value:
@@ -111,35 +100,55 @@ def cast_vote(request, data: CastVoteSchema):
                 return 400, {"message": "Text response cannot exceed 50 characters"}
 
             # Submit the text response using transaction
-            with transaction.atomic():
-                # Create the text response
-                PollTextResponse.objects.create(
-                    poll=poll,
-                    profile=profile,
-                    text_value=text_value,
-                )
+            try:
+                with transaction.atomic():
+                    # Create the text response
+                    PollTextResponse.objects.create(
+                        poll=poll,
+                        profile=profile,
+                        text_value=text_value,
+                    )
 
-                # Update poll counts (new voter)
-                poll.increment_vote_count(is_new_voter=True)
+                    answer_result = StreakService.process_poll_answer(
+                        profile=profile, poll=poll, text_response=text_value
+                    )
 
-                answer_result = StreakService.process_poll_answer(
-                    profile=profile, poll=poll, text_response=text_value
-                )
+                    # Update poll counts (new voter)
+                    Poll.bulk_increment(
+                        poll.id,
+                        1,
+                        voters_delta=1,
+                        correct_delta=_correct_delta(poll, answer_result),
+                    )
 
-                PollTextAggregate.update_aggregates_for_poll(poll)
+                    PollTextAggregate.update_aggregates_for_poll(poll)
 
-                # Refresh poll data to get updated counts
-                poll.refresh_from_db()
+                    # Only the vote counters changed, re-read just those
+                    poll.refresh_from_db(fields=VOTE_COUNTER_FIELDS)
 
-                # Return enhanced poll details with answer result
-                poll_details = PollDetails.resolve(poll, profile)
+                    # Return enhanced poll details with answer result
+                    poll_details = PollDetails.resolve(poll, profile)
 
-                # Add answer result info to response
-                poll_details.user_answer_correct = answer_result["is_correct"]
-                poll_details.user_earned_aura = answer_result["aura_earned"]
-                poll_details.user_streak_info = answer_result["streak_info"]
+                    # Add answer result info to response
+                    poll_details["user_answer_correct"] = answer_result["is_correct"]
+                    poll_details["user_earned_aura"] = answer_result["aura_earned"]
+                    poll_details["user_streak_info"] = answer_result["streak_info"]
 
-                return 200, poll_details
+                    return 200, poll_details
+            except IntegrityError:
+                # Text responses are unique per profile and poll, so the
+                # database rejects a second response. Anything else is a
+                # real failure.
+                if not PollTextResponse.objects.filter(
+                    poll=poll, profile=profile
+                ).exists():
+                    raise
+                return 400, {
+                    "message": (
+                        "You have already responded to this poll "
+                        "and cannot change your response"
+                    ),
+                }
 
         # Handle option-based polls (single, multiple, ranking)
         else:
@@ -164,61 +173,90 @@ def cast_vote(request, data: CastVoteSchema):
             if not validation_result["valid"]:
                 return 400, {"message": validation_result["error"]}
 
-            # Cast the votes using transaction
-            with transaction.atomic():
-                votes_created = []
-
-                for vote_data in data.votes:
-                    option = poll_options[vote_data.option_id]
+            # Votes cast before answer results were tracked have no
+            # PollAnswerResult to collide with, so check the ballot itself
+            if PollVote.objects.filter(poll=poll, profile=profile).exists():
+                return 400, {
+                    "message": (
+                        "You have already voted on this poll "
+                        "and cannot change your vote"
+                    ),
+                }
 
-                    # Create the vote
-                    vote = PollVote.objects.create(
-                        poll=poll, option=option, profile=profile, rank=vote_data.rank
+            # Cast the votes using transaction
+            try:
+                with transaction.atomic():
+                    # Insert the ballot in one statement, however many
+                    # options were picked
+                    PollVote.objects.bulk_create(
+                        [
+                            PollVote(
+                                poll=poll,
+                                option_id=vote_data.option_id,
+                                profile=profile,
+                                rank=vote_data.rank,
+                            )
+                            for vote_data in data.votes
+                        ]
                     )
-                    votes_created.append(vote)
-
-                    # Update option vote count
-                    option.increment_vote_count()
-
-                # Update poll vote counts
-                if poll.poll_type == "ranking":
-                    # For ranking polls: each user contributes 1 to total_voters
-                    # and total_votes equals total_voters
-                    poll.increment_vote_count(is_new_voter=True)
-                else:
-                    # For single/multiple choice: count each individual vote
-                    total_vote_count = len(data.votes)
-                    poll.increment_vote_count(is_new_voter=True)
-
-                    # Add remaining votes if multiple votes were cast
-                    if total_vote_count > 1:
-                        poll.total_votes = models.F("total_votes") + (
-                            total_vote_count - 1
-                        )
-                        poll.save(update_fields=["total_votes"])
-
-                # Convert votes to format expected by streak service
-                user_votes = [
-                    {"option_id": vote_data.option_id, "rank": vote_data.rank}
-                    for vote_data in data.votes
-                ]
 
-                answer_result = StreakService.process_poll_answer(
-                    profile=profile, poll=poll, user_votes=user_votes
-                )
+                    # Convert votes to format expected by streak service
+                    user_votes = [
+                        {"option_id": vote_data.option_id, "rank": vote_data.rank}
+                        for vote_data in data.votes
+                    ]
 
-                # Refresh poll data to get updated counts
-                poll.refresh_from_db()
+                    answer_result = StreakService.process_poll_answer(
+                        profile=profile, poll=poll, user_votes=user_votes
+                    )
 
-                # Return enhanced poll details with answer result
-                poll_details = PollDetails.resolve(poll, profile)
+                    # Every voter bumps the same option and poll rows, so take
+                    # those row locks last, after the per-profile writes above.
+                    PollOption.bulk_increment(
+                        [vote_data.option_id for vote_data in data.votes]
+                    )
 
-                # # Add answer result info to response
-                # poll_details.user_answer_correct = answer_result["is_correct"]
-                # poll_details.user_earned_aura = answer_result["aura_earned"]
-                # poll_details.user_streak_info = answer_result["streak_info"]
+                    # Each voter adds one to total_voters. Ranking polls count
+                    # a ballot as one vote, single/multiple choice count each
+                    # selected option.
+                    votes_delta = 1 if poll.poll_type == "ranking" else len(data.votes)
+                    Poll.bulk_increment(
+                        poll.id,
+                        votes_delta,
+                        voters_delta=1,
+                        correct_delta=_correct_delta(poll, answer_result),
+                    )
 
-                return 200, poll_details
+                    # Only the vote counters changed, re-read just those. The
+                    # prefetched options have stale counts now, so drop them
+                    # and let resolve load their new counts.
+                    poll.refresh_from_db(fields=VOTE_COUNTER_FIELDS)
+                    poll._prefetched_objects_cache.pop("options", None)
+
+                    # Return enhanced poll details with answer result
+                    poll_details = PollDetails.resolve(poll, profile)
+
+                    # # Add answer result info to response
+                    # poll_details.user_answer_correct = answer_result["is_correct"]
+                    # poll_details.user_earned_aura = answer_result["aura_earned"]
+                    # poll_details.user_streak_info = answer_result["streak_info"]
+
+                    return 200, poll_details
+            except IntegrityError:
+                # Every ballot records a PollAnswerResult, which is unique
+                # per profile and poll, so the database rejects a second one
+                # from a concurrent request. Anything else, like an option
+                # deleted meanwhile, is a real failure.
+                if not PollAnswerResult.objects.filter(
+                    poll=poll, profile=profile
+                ).exists():
+                    raise
+                return 400, {
+                    "message": (
+                        "You have already voted on this poll "
+                        "and cannot change your vote"
+                    ),
+                }
 
     except Exception as e:
         logger.error(
@@ -365,9 +403,11 @@ def list_polls(
             return 400, {"message": "Authentication required for user-specific filters"}
 
         # === BUILD BASE QUERYSET ===
+        # Load everything PollDetails.resolve walks up front, so the page
+        # costs a fixed number of queries however many polls it holds
         polls = (
-            Poll.objects.select_related("community", "community__category", "profile")
-            .prefetch_related("options")
+            PollDetails.with_related(Poll.objects, profile)
+            .defer(*FEED_DEFERRED_FIELDS)
             .filter(is_deleted=False)
         )
 
@@ -537,11 +577,7 @@ def list_polls(
                         applied_filters["staff_viewing_author"] = True
                     else:
                         # Regular users can only see public statuses from others
-                        status = [
-                            s
-                            for s in status
-                            if s not in ["draft", "pending_moderation", "rejected"]
-                        ]
+                        status = [s for s in status if s not in Poll.HIDDEN_STATUSES]
                         if not status:
                             status = ["active", "closed"]
                         applied_filters["filtered_other_author_statuses"] = True
@@ -566,8 +602,7 @@ def list_polls(
 
             # === APPLY STATUS FILTER ===
             # Check for sensitive statuses that require special permissions
-            sensitive_statuses = ["pending_moderation", "rejected"]
-            has_sensitive_status = any(s in sensitive_statuses for s in status)
+            has_sensitive_status = not Poll.MODERATION_STATUSES.isdisjoint(status)
 
             if has_sensitive_status and not profile:
                 return 400, {
@@ -583,7 +618,7 @@ def list_polls(
                     or (hasattr(profile, "is_staff") and profile.is_staff)
                 ):
                     # Remove sensitive statuses for non-owners/non-staff
-                    status = [s for s in status if s not in sensitive_statuses]
+                    status = [s for s in status if s not in Poll.MODERATION_STATUSES]
                     applied_filters["filtered_sensitive_statuses"] = True
 
             if status:
@@ -748,10 +783,7 @@ def list_polls(
 
             # Add moderation info for appropriate users
             for poll_data in polls_data:
-                if (
-                    poll_data["status"] in ["pending_moderation", "rejected"]
-                    and profile
-                ):
+                if poll_data["status"] in Poll.MODERATION_STATUSES and profile:
                     # Find the original poll object to check ownership
                     original_poll = next(
                         p for p in page_obj.object_list if p.id == poll_data["id"]
@@ -787,3 +819,10 @@ def list_polls(
             "success": False,
             "message": "An error occurred while fetching polls",
         }
+
+
+def _correct_delta(poll: Poll, answer_result) -> int:
+    """Return 1 if a ballot adds to the poll's correct voters, else 0"""
+    # Answers to polls without a correct answer are always marked correct,
+    # but they don't count towards correct answer stats
+    return int(poll.has_correct_answer and answer_result["is_correct"])
@@ -1,13 +1,18 @@
 import logging
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import models, transaction
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.text import slugify
 from ninja import File, Router, UploadedFile
-from ninja.errors import ValidationError
 
 from keyopolls.common.models import Tag, TaggedItem
 from keyopolls.common.schemas import Message
@@ -25,6 +30,12 @@ from keyopolls.utils.contentUtils import increment_aura
 logger = logging.getLogger(__name__)
 router = Router(tags=["Polls"], auth=PseudonymousJWTAuth())
 
+# Maximum number of uploads saved to storage concurrently per request
+MAX_UPLOAD_WORKERS = 8
+
+# Polls a profile can create per community per day
+DAILY_POLL_LIMIT = 100
+
 
 @router.post(
     "/polls",
@@ -42,230 +53,153 @@ def create_poll(
     """Create a new poll in a community"""
     profile = request.auth
 
-    try:
-        # Validate community exists and user can post
+    # Reject malformed payloads before running any queries
+    error = data.validation_error()
+    if error:
+        return 400, {"message": error}
+
+    # Load the membership together with its community (and the category,
+    # used by moderation) in one query, only falling back to a plain
+    # community lookup for non-members
+    membership = (
+        CommunityMembership.objects.select_related("community__category")
+        .filter(
+            community_id=data.community_id,
+            community__is_active=True,
+            profile=profile,
+        )
+        .first()
+    )
+    if membership:
+        community = membership.community
+    else:
         try:
-            community = Community.objects.get(id=data.community_id, is_active=True)
+            community = Community.objects.select_related("category").get(
+                id=data.community_id, is_active=True
+            )
         except Community.DoesNotExist:
             return 400, {"message": "Community not found"}
 
-        # Validate folder if provided
-        folder = None
-        if data.folder_id:
-            try:
-                folder = PollList.objects.get(
-                    id=data.folder_id,
-                    community=community,
-                    is_deleted=False,
-                )
-            except PollList.DoesNotExist:
-                return 400, {"message": "Folder not found or invalid"}
-
-            # Check if user can add polls to this folder
-            if not folder.can_add_polls(profile):
-                return 403, {
-                    "message": "You don't have permission to add polls to this folder"
-                }
-
-        # Handle membership logic based on community type
-        membership = None
-        if community.community_type == "public":
-            # For public communities, check if user can post directly
-            if not community.can_post(profile):
-                return 403, {
-                    "message": f"You need at least {community.requires_aura_to_post} "
-                    "aura to post in this community"
-                }
-
-            # Check if user is already a member
-            try:
-                membership: CommunityMembership = community.memberships.get(
-                    profile=profile
-                )
-                if not membership.is_active_member:
-                    # User exists but not active (banned/left), they cannot post
-                    return 403, {
-                        "message": "You are not allowed to post in this community"
-                    }
-            except CommunityMembership.DoesNotExist:
-                # Will create membership after poll creation
-                pass
-
-        else:
-            # For private/restricted communities, membership is required
-            try:
-                membership = community.memberships.get(profile=profile)
-                if not membership.is_active_member:
-                    return 403, {
-                        "message": "You must be an active member to create polls"
-                    }
-            except CommunityMembership.DoesNotExist:
-                return 403, {
-                    "message": "You must be a member of this community to create polls"
-                }
-
-            # Check if user can post in community
-            if not community.can_post(profile):
-                return 403, {
-                    "message": f"You need at least {community.requires_aura_to_post} "
-                    "aura to post in this community"
-                }
-
-        # Validate poll data
-        if data.poll_type not in ["single", "multiple", "ranking", "text_input"]:
-            return 400, {"message": "Invalid poll type"}
-
-        # Validate options based on poll type
-        if data.poll_type == "text_input":
-            if data.options:
-                return 400, {
-                    "message": "Text input polls cannot have predefined options"
-                }
-            # Don't validate multiple votes settings for text input - we'll ignore them
-        else:
-            # Option-based polls
-            if len(data.options) < 2:
-                return 400, {"message": "Poll must have at least 2 options"}
-            if len(data.options) > 10:  # Increased limit
-                return 400, {"message": "Poll cannot have more than 10 options"}
-
-        # Validate multiple choice settings
-        if data.poll_type == "multiple":
-            if data.max_choices and data.max_choices > len(data.options):
-                return 400, {"message": "max_choices cannot exceed number of options"}
-
-        # Validate correct answers
-        if data.has_correct_answer:
-            if data.poll_type == "text_input":
-                if not data.correct_text_answer:
-                    return 400, {
-                        "message": (
-                            "Text input polls with correct answers must specify "
-                            "correct_text_answer"
-                        )
-                    }
-                if " " in data.correct_text_answer.strip():
-                    return 400, {"message": "Correct text answer cannot contain spaces"}
-
-            elif data.poll_type == "ranking":
-                if not data.correct_ranking_order:
-                    return 400, {
-                        "message": (
-                            "Ranking polls with correct answers must specify "
-                            "correct_ranking_order"
-                        )
-                    }
-                if len(data.correct_ranking_order) != len(data.options):
-                    return 400, {
-                        "message": "Correct ranking order must include all options"
-                    }
-                # Validate that all option orders are included
-                option_orders = {opt.order for opt in data.options}
-                if set(data.correct_ranking_order) != option_orders:
-                    return 400, {
-                        "message": (
-                            "Correct ranking order must include all option orders "
-                            "exactly once"
-                        )
-                    }
-
-            elif data.poll_type in ["single", "multiple"]:
-                correct_options = [opt for opt in data.options if opt.is_correct]
-                if not correct_options:
-                    return 400, {
-                        "message": (
-                            f"{data.poll_type.title()} choice polls with correct "
-                            "answers must have at least one correct option"
-                        )
-                    }
-                if data.poll_type == "single" and len(correct_options) > 1:
-                    return 400, {
-                        "message": (
-                            "Single choice polls can only have one correct option"
-                        )
-                    }
-
-        # Validate explanation field (mandatory)
-        if not data.explanation or len(data.explanation.strip()) < 250:
-            return 400, {"message": "Explanation must be at least 250 characters"}
+    # Validate folder if provided
+    folder = None
+    if data.folder_id:
+        try:
+            folder = PollList.objects.get(
+                id=data.folder_id,
+                community=community,
+                is_deleted=False,
+            )
+        except PollList.DoesNotExist:
+            return 400, {"message": "Folder not found or invalid"}
 
-        # Validate todos
-        if hasattr(data, "todos") and data.todos:
-            if len(data.todos) > 5:
-                return 400, {"message": "Cannot create more than 5 todos per poll"}
+        # Check if user can add polls to this folder
+        if not folder.can_add_polls(profile):
+            return 403, {
+                "message": "You don't have permission to add polls to this folder"
+            }
 
-            for todo in data.todos:
-                if not todo.text or len(todo.text.strip()) == 0:
-                    return 400, {"message": "Todo text cannot be empty"}
-                if len(todo.text.strip()) > 400:
-                    return 400, {"message": "Todo text cannot exceed 400 characters"}
+    # Aura/activity check shared by both community types
+    can_post = community.can_post(profile)
 
-        # Validate option images
-        if option_images:
-            if data.poll_type == "text_input":
-                if len(option_images) > 1:
-                    return 400, {"message": "Text input polls can only have one image"}
-            else:
-                if len(option_images) > len(data.options):
-                    return 400, {"message": "Too many images provided for options"}
-
-        # Validate tags
-        if hasattr(data, "tags") and data.tags:
-            if len(data.tags) > 5:  # Limit to 5 tags max
-                return 400, {"message": "Poll cannot have more than 5 tags"}
-
-            # Validate each tag
-            for tag_name in data.tags:
-                if not tag_name or len(tag_name.strip()) == 0:
-                    return 400, {"message": "Tag name cannot be empty"}
-                if len(tag_name.strip()) > 50:
-                    return 400, {"message": "Tag name cannot exceed 50 characters"}
-                # Check for valid characters (letters, numbers, hyphens, underscores)
-                if (
-                    not tag_name.replace("-", "")
-                    .replace("_", "")
-                    .replace(" ", "")
-                    .isalnum()
-                ):
-                    return 400, {
-                        "message": f"Tag '{tag_name}' contains invalid characters"
-                    }
-
-        # Check daily poll limit (3 polls per day per community)
-        today = timezone.now().date()
-        daily_poll_count = Poll.objects.filter(
-            profile=profile, community=community, created_at__date=today
-        ).count()
-
-        if daily_poll_count >= 100:
-            return 400, {
-                "message": "You can only create 100 polls per day in this community"
+    # Handle membership logic based on community type
+    if community.community_type == "public":
+        # For public communities, check if user can post directly
+        if not can_post:
+            return 403, {
+                "message": f"You need at least {community.requires_aura_to_post} "
+                "aura to post in this community"
             }
 
-        # Check if user is creator or moderator
-        is_creator = community.memberships.filter(
-            profile=profile, role="creator", status="active"
-        ).exists()
-        is_moderator = False
+        # Existing members must be active; non-members get a membership
+        # after poll creation
+        if membership and not membership.is_active_member:
+            # User exists but not active (banned/left), they cannot post
+            return 403, {"message": "You are not allowed to post in this community"}
 
-        if membership:
-            is_moderator = membership.can_moderate
+    else:
+        # For private/restricted communities, membership is required
+        if not membership:
+            return 403, {
+                "message": "You must be a member of this community to create polls"
+            }
+        if not membership.is_active_member:
+            return 403, {"message": "You must be an active member to create polls"}
 
-        if not (is_creator or is_moderator):
+        # Check if user can post in community
+        if not can_post:
             return 403, {
-                "message": "Only community creators and moderators can create polls"
+                "message": f"You need at least {community.requires_aura_to_post} "
+                "aura to post in this community"
             }
 
-        # Use database transaction
+    # The payload was validated above, only the uploaded images need
+    # checking here
+    if option_images:
+        if data.poll_type == "text_input":
+            if len(option_images) > 1:
+                return 400, {"message": "Text input polls can only have one image"}
+        elif len(option_images) > len(data.options):
+            return 400, {"message": "Too many images provided for options"}
+
+    # Check if user is creator or moderator. Memberships are unique per
+    # community and profile, so the membership loaded above already
+    # carries the creator role.
+    if not (membership and membership.can_moderate):
+        return 403, {
+            "message": "Only community creators and moderators can create polls"
+        }
+
+    # Normalize tags and compute their slugs before opening the transaction
+    tag_slugs_by_name = _prepare_tags(data.tags or [])
+    if tag_slugs_by_name:
+        error = _find_tag_conflict(tag_slugs_by_name)
+        if error:
+            return 400, {"message": error}
+
+    # Check daily poll limit, counting this poll towards it up front. It is
+    # released again below if creating the poll fails.
+    daily_count_key = _daily_poll_count_key(profile, community)
+    if not _reserve_daily_poll(daily_count_key, profile, community):
+        return 400, {
+            "message": (
+                f"You can only create {DAILY_POLL_LIMIT} polls per day "
+                "in this community"
+            )
+        }
+
+    # Write uploads to storage up front. With async poll tasks enabled,
+    # verifying them and attaching them to the poll is left to a worker.
+    # Storage isn't transactional, so the uploads are deleted again below
+    # if creating the poll fails.
+    image_model = Poll if data.poll_type == "text_input" else PollOption
+    stored_images = _store_uploads(image_model, option_images or [])
+    defer_images = settings.USE_ASYNC_POLL_TASKS and bool(stored_images)
+    attached_images = [] if defer_images else stored_images
+
+    # With moderation enabled, polls start out pending and only count
+    # towards the community once approved
+    moderate = settings.POLL_MODERATION_ENABLED
+
+    # Only the writes can fail on database constraints (e.g. two options
+    # sharing the same order)
+    try:
         with transaction.atomic():
+            # Community counters, written in a single UPDATE at the end
+            community_updates = {}
+            if not moderate:
+                community_updates["poll_count"] = models.F("poll_count") + 1
+
             # For public communities, auto-join user if they're not already a member
+            # get_or_create leans on the (community, profile) unique constraint,
+            # so a concurrent request joining first doesn't create a duplicate
             if community.community_type == "public" and membership is None:
-                membership = CommunityMembership.objects.create(
-                    community=community, profile=profile, role="member", status="active"
+                membership, joined = CommunityMembership.objects.get_or_create(
+                    community=community,
+                    profile=profile,
+                    defaults={"role": "member", "status": "active"},
                 )
-                # Update community member count
-                community.member_count = models.F("member_count") + 1
-                community.save(update_fields=["member_count"])
+                if joined:
+                    community_updates["member_count"] = models.F("member_count") + 1
 
             # Prepare poll creation data
             poll_data = {
@@ -280,7 +214,7 @@ def create_poll(
                 "option_count": (
                     len(data.options) if data.poll_type != "text_input" else 0
                 ),
-                "status": "active",  # Direct approval without moderation
+                "status": "pending_moderation" if moderate else "active",
             }
 
             # Add poll-type-specific fields
@@ -297,102 +231,130 @@ def create_poll(
                 if data.correct_ranking_order:
                     poll_data["correct_ranking_order"] = data.correct_ranking_order
 
-            # Create the poll (with active status)
-            poll = Poll.objects.create(**poll_data)
+            # For text input polls, store the image in the poll's image field
+            if data.poll_type == "text_input" and attached_images:
+                poll_data["image"] = attached_images[0]
 
-            # Handle images for text input polls
-            if data.poll_type == "text_input" and option_images:
-                # For text input polls, store the image in the poll's image field
-                poll.image = option_images[0]
-                poll.save()
+            # Assign poll to the folder directly
+            if folder:
+                poll_data["poll_list"] = folder
+
+            # Create the poll (with active status) in a single INSERT
+            poll = Poll.objects.create(**poll_data)
 
             # Create poll options (only for non-text-input polls)
+            # Create all options in one INSERT, pairing images by position
+            options = []
             if data.poll_type != "text_input":
-                for i, option_data in enumerate(data.options):
-                    option = PollOption.objects.create(
-                        poll=poll,
-                        text=option_data.text.strip(),
-                        order=option_data.order,
-                        is_correct=(option_data.is_correct),
-                    )
+                images = attached_images + [None] * (
+                    len(data.options) - len(attached_images)
+                )
+                options = PollOption.objects.bulk_create(
+                    [
+                        PollOption(
+                            poll=poll,
+                            text=option_data.text.strip(),
+                            order=option_data.order,
+                            is_correct=data.has_correct_answer
+                            and option_data.is_correct,
+                            image=image,
+                        )
+                        for option_data, image in zip(data.options, images)
+                    ]
+                )
 
-                    # Add image if provided
-                    if option_images and i < len(option_images):
-                        option.image = option_images[i]
-                        option.save()
+            if defer_images:
+                from keyopolls.polls.tasks import attach_poll_images_task
+
+                # Pair each stored image with its option (None for the poll)
+                if data.poll_type == "text_input":
+                    image_targets = [[None, stored_images[0]]]
+                else:
+                    image_targets = [
+                        [option.id, name]
+                        for option, name in zip(options, stored_images)
+                    ]
+                poll_id = poll.id
+                transaction.on_commit(
+                    lambda: attach_poll_images_task.delay(poll_id, image_targets)
+                )
 
-            # Add poll to folder if specified
+            # Update folder counts once the poll is committed
             if folder:
-                # Assign poll to the folder directly
-                poll.poll_list = folder
-                poll.save(update_fields=["poll_list"])
-
-                # Update folder counts
-                folder.update_counts()
+                transaction.on_commit(folder.update_counts)
 
             # Create todos
+            todos = []
             if hasattr(data, "todos") and data.todos:
                 for todo in data.todos:
                     todo_text = todo.text.strip()
                     if todo_text:  # Skip empty todos
-                        PollTodo.objects.create(
-                            poll=poll, profile=profile, text=todo_text
+                        todos.append(
+                            PollTodo.objects.create(
+                                poll=poll, profile=profile, text=todo_text
+                            )
                         )
 
             # Handle tags
-            if hasattr(data, "tags") and data.tags:
-                poll_content_type = ContentType.objects.get_for_model(Poll)
-
-                for tag_name in data.tags:
-                    tag_name = tag_name.strip().lower()  # Normalize tag name
-                    if tag_name:  # Skip empty tags
-                        # Generate slug
-                        tag_slug = slugify(tag_name)
-
-                        # Get or create the tag
-                        tag, created = Tag.objects.get_or_create(
-                            name=tag_name, defaults={"slug": tag_slug}
-                        )
-
-                        # Create the TaggedItem relationship
-                        TaggedItem.objects.get_or_create(
-                            tag=tag,
-                            content_type=poll_content_type,
-                            object_id=poll.id,
-                            community=community,
-                        )
-
-            # Update community poll count
-            community.poll_count = models.F("poll_count") + 1
-            community.save(update_fields=["poll_count"])
-
+            tag_slugs = []
+            if tag_slugs_by_name:
+                tags_by_name = _upsert_tags(tag_slugs_by_name)
+                _add_poll_tags(poll, community, tags_by_name.values())
+                tag_slugs = [tags_by_name[name].slug for name in tag_slugs_by_name]
+
+            # Update community poll count (and member count on auto-join)
+            if community_updates:
+                Community.objects.filter(pk=community.pk).update(**community_updates)
+
+            # Moderate the poll on a worker once it's committed, so neither
+            # the request nor any locks wait on the moderation API call.
+            # Approval awards the creation aura.
+            if moderate:
+                poll_id = poll.id
+                transaction.on_commit(
+                    lambda: _queue_poll_moderation(poll_id, stored_images)
+                )
             # Increment user's poll aura by 1 point for successful poll creation
-            try:
-                aura_result = increment_aura(profile, "polls", 1)
-                logger.info(
-                    f"Aura incremented for user {profile.id} after poll "
-                    f"creation: {aura_result}"
+            elif settings.USE_ASYNC_POLL_TASKS:
+                from keyopolls.polls.tasks import finalize_poll_creation_task
+
+                poll_id, profile_id = poll.id, profile.id
+                transaction.on_commit(
+                    lambda: finalize_poll_creation_task.delay(poll_id, profile_id)
                 )
-            except Exception as aura_error:
-                # Log the error but don't fail the poll creation
-                logger.error(
-                    f"Failed to increment aura for user {profile.id}: "
-                    f"{str(aura_error)}"
+            else:
+                # Award it after commit so the profile row isn't locked for
+                # the rest of the poll transaction
+                transaction.on_commit(lambda: _award_poll_creation_aura(profile))
+
+            # Build the response from the objects created above instead of
+            # reloading the poll and resolving it from scratch
+            user_can_vote = (
+                poll.is_active
+                and (
+                    poll.requires_aura == 0 or profile.total_aura >= poll.requires_aura
                 )
+                and membership.is_active_member
+            )
 
-            # Refresh poll with options
-            poll.refresh_from_db()
-
-            return 201, PollDetails.resolve(poll, profile)
-
-    except ValidationError as e:
-        logger.error(f"Validation error: {str(e)}")
-        return 400, {"message": str(e)}
-    except Exception as e:
-        logger.error(f"Error creating poll: {str(e)}", exc_info=True)
-        return 400, {
-            "message": "An error occurred while creating the poll",
-        }
+            return 201, PollDetails.resolve_created(
+                poll,
+                options,
+                todos,
+                tag_slugs,
+                user_can_vote,
+                image_pending=defer_images,
+            )
+    except IntegrityError as e:
+        logger.error(f"Integrity error creating poll: {str(e)}")
+        _delete_uploads(image_model, stored_images)
+        _release_daily_poll(daily_count_key)
+        return 400, {"message": "Poll conflicts with existing data"}
+    except Exception:
+        # The request transaction rolls back, leaving the uploads orphaned
+        _delete_uploads(image_model, stored_images)
+        _release_daily_poll(daily_count_key)
+        raise
 
 
 @router.put(
@@ -408,91 +370,93 @@ def update_poll(request: HttpRequest, poll_id: int, data: PollUpdateSchema):
     """Update poll title, description, explanation, and tags"""
     profile = request.auth
 
-    try:
-        # Get the poll
-        try:
-            poll = Poll.objects.get(id=poll_id, is_deleted=False)
-        except Poll.DoesNotExist:
-            return 404, {"message": "Poll not found"}
+    # Reject malformed payloads before loading the poll
+    error = data.validation_error()
+    if error:
+        return 400, {"message": error}
 
-        # Check if user is the author
-        if poll.profile.id != profile.id:
-            return 403, {"message": "You can only edit your own polls"}
-
-        # Validate title
-        if not data.title.strip():
-            return 400, {"message": "Title cannot be empty"}
-
-        # Validate explanation if provided
-        if hasattr(data, "explanation") and data.explanation is not None:
-            if len(data.explanation.strip()) < 250:
-                return 400, {"message": "Explanation must be at least 250 characters"}
-
-        # Validate tags if provided
-        if hasattr(data, "tags") and data.tags:
-            if len(data.tags) > 5:
-                return 400, {"message": "Poll cannot have more than 5 tags"}
-
-            for tag_name in data.tags:
-                if not tag_name or len(tag_name.strip()) == 0:
-                    return 400, {"message": "Tag name cannot be empty"}
-                if len(tag_name.strip()) > 50:
-                    return 400, {"message": "Tag name cannot exceed 50 characters"}
-                if (
-                    not tag_name.replace("-", "")
-                    .replace("_", "")
-                    .replace(" ", "")
-                    .isalnum()
-                ):
-                    return 400, {
-                        "message": f"Tag '{tag_name}' contains invalid characters"
-                    }
-
-        with transaction.atomic():
-            # Update basic fields
-            poll.title = data.title.strip()
-            poll.description = data.description.strip()
-
-            update_fields = ["title", "description", "updated_at"]
-
-            # Update explanation if provided
-            if hasattr(data, "explanation") and data.explanation is not None:
-                poll.explanation = data.explanation.strip()
-                update_fields.append("explanation")
-
-            poll.save(update_fields=update_fields)
-
-            # Handle tags if provided
-            if hasattr(data, "tags") and data.tags is not None:
-                poll_content_type = ContentType.objects.get_for_model(Poll)
-
-                # Remove existing tags
-                TaggedItem.objects.filter(
-                    content_type=poll_content_type, object_id=poll.id
-                ).delete()
-
-                # Add new tags
-                for tag_name in data.tags:
-                    tag_name = tag_name.strip().lower()
-                    if tag_name:
-                        tag_slug = slugify(tag_name)
-                        tag, created = Tag.objects.get_or_create(
-                            name=tag_name, defaults={"slug": tag_slug}
-                        )
-                        TaggedItem.objects.get_or_create(
-                            tag=tag,
-                            content_type=poll_content_type,
-                            object_id=poll.id,
-                            community=poll.community,
-                        )
+    # Get the poll along with everything the response needs, skipping the
+    # moderation notes which neither the update nor the response use
+    try:
+        poll = (
+            PollDetails.with_related(Poll.objects)
+            .defer("moderation_reason", "moderated_at")
+            .get(id=poll_id, is_deleted=False)
+        )
+    except Poll.DoesNotExist:
+        return 404, {"message": "Poll not found"}
+
+    # Check if user is the author
+    if poll.profile.id != profile.id:
+        return 403, {"message": "You can only edit your own polls"}
+
+    # Normalize tags and compute their slugs before opening the transaction
+    tag_slugs_by_name = _prepare_tags(data.tags) if data.tags is not None else None
+
+    # Only write the fields whose value actually changed
+    changed = {}
+    if poll.title != data.title.strip():
+        changed["title"] = data.title.strip()
+    if poll.description != data.description.strip():
+        changed["description"] = data.description.strip()
+    if hasattr(data, "explanation") and data.explanation is not None:
+        if poll.explanation != data.explanation.strip():
+            changed["explanation"] = data.explanation.strip()
+
+    # Diff the requested tags against the (prefetched) current ones
+    tags_to_remove = []
+    new_tags = {}
+    if tag_slugs_by_name is not None:
+        current_tags = {
+            tagged_item.tag.name: tagged_item.tag
+            for tagged_item in poll.tagged_items.all()
+        }
+        tags_to_remove = [
+            tag for name, tag in current_tags.items() if name not in tag_slugs_by_name
+        ]
+        new_tags = {
+            name: slug
+            for name, slug in tag_slugs_by_name.items()
+            if name not in current_tags
+        }
+        if new_tags:
+            error = _find_tag_conflict(new_tags)
+            if error:
+                return 400, {"message": error}
 
-        return 200, PollDetails.resolve(poll, profile)
+    # Nothing to write when the form was re-saved unchanged
+    if changed or tags_to_remove or new_tags:
+        try:
+            with transaction.atomic():
+                # Update basic fields
+                if changed:
+                    for field, value in changed.items():
+                        setattr(poll, field, value)
+                    poll.save(update_fields=[*changed, "updated_at"])
+
+                # Only touch the tags that changed
+                if tags_to_remove:
+                    _remove_poll_tags(poll, tags_to_remove)
+                if new_tags:
+                    _add_poll_tags(
+                        poll, poll.community, _upsert_tags(new_tags).values()
+                    )
+        except IntegrityError as e:
+            logger.error(f"Integrity error updating poll {poll_id}: {str(e)}")
+            return 400, {"message": "Poll update conflicts with existing data"}
+
+        if tags_to_remove or new_tags:
+            # Re-prefetch only the tags; the rest of the poll is still current
+            poll._prefetched_objects_cache.pop("tagged_items", None)
+            prefetch_related_objects(
+                [poll],
+                Prefetch(
+                    "tagged_items",
+                    queryset=TaggedItem.objects.select_related("tag"),
+                ),
+            )
 
-    except Exception as e:
-        logger.error(f"Error updating poll {poll_id}: {str(e)}", exc_info=True)
-        return 400, {
-            "message": "An error occurred while updating the poll",
-        }
+    return 200, PollDetails.resolve_fast(poll, profile)
 
 
 @router.delete(
@@ -509,21 +473,27 @@ def delete_poll(request: HttpRequest, poll_id: int):
     profile = request.auth
 
     try:
-        # Get the poll
+        # Get the poll, only loading what the permission check needs
         try:
-            poll = Poll.objects.get(id=poll_id, is_deleted=False)
+            poll = Poll.objects.only("id", "profile_id", "community_id", "status").get(
+                id=poll_id, is_deleted=False
+            )
         except Poll.DoesNotExist:
             return 404, {"message": "Poll not found"}
 
         # Check if user is the author or community moderator
-        is_author = poll.profile.id == profile.id
+        is_author = poll.profile_id == profile.id
         is_moderator = False
 
-        try:
-            membership = poll.community.memberships.get(profile=profile)
-            is_moderator = membership.can_moderate
-        except CommunityMembership.DoesNotExist:
-            pass
+        if not is_author:
+            try:
+                # can_moderate only needs the role and status
+                membership = CommunityMembership.objects.only("role", "status").get(
+                    community_id=poll.community_id, profile=profile
+                )
+                is_moderator = membership.can_moderate
+            except CommunityMembership.DoesNotExist:
+                pass
 
         if not (is_author or is_moderator):
             return 403, {
@@ -531,14 +501,19 @@ def delete_poll(request: HttpRequest, poll_id: int):
                 "community polls",
             }
 
-        # Soft delete the poll
-        poll.is_deleted = True
-        poll.status = "archived"
-        poll.save(update_fields=["is_deleted", "status", "updated_at"])
+        # Soft delete the poll, guarding against a concurrent delete
+        updated = Poll.objects.filter(id=poll_id, is_deleted=False).update(
+            is_deleted=True, status="archived", updated_at=timezone.now()
+        )
+        if not updated:
+            return 404, {"message": "Poll not found"}
 
-        # Decrement community poll count
-        poll.community.poll_count = models.F("poll_count") - 1
-        poll.community.save(update_fields=["poll_count"])
+        # Decrement community poll count, unless the poll never made it
+        # through moderation and so was never counted
+        if poll.status not in Poll.MODERATION_STATUSES:
+            Community.objects.filter(pk=poll.community_id).update(
+                poll_count=models.F("poll_count") - 1
+            )
 
         return 200, {"message": "Poll deleted successfully"}
 
@@ -555,6 +530,222 @@ def check_poll_ownership(poll: Poll, profile) -> bool:
     return poll.profile.id == profile.id
 
 
+# Aura helpers
+def _award_poll_creation_aura(profile) -> None:
+    """Increment poll aura for a created poll, logging instead of raising"""
+    try:
+        aura_result = increment_aura(profile, "polls", 1)
+        logger.info(
+            f"Aura incremented for user {profile.id} after poll "
+            f"creation: {aura_result}"
+        )
+    except Exception as aura_error:
+        # Log the error but don't fail the poll creation
+        logger.error(
+            f"Failed to increment aura for user {profile.id}: {str(aura_error)}"
+        )
+
+
+# Moderation helpers
+def _queue_poll_moderation(poll_id: int, image_names: List[str]) -> None:
+    """Queue moderation of a created poll, logging instead of raising"""
+    from keyopolls.polls.tasks import moderate_poll_task
+
+    try:
+        moderate_poll_task.delay(poll_id, image_names)
+    except Exception as queue_error:
+        # The poll is already committed, so it stays pending rather than
+        # failing the request
+        logger.error(
+            f"Failed to queue moderation for poll {poll_id}: {str(queue_error)}"
+        )
+
+
+# Daily poll limit helpers
+def _daily_poll_count_key(profile, community) -> str:
+    """Cache key for a profile's poll count in a community for today"""
+    today = timezone.now().date()
+    return f"poll_create_count:{profile.id}:{community.id}:{today.isoformat()}"
+
+
+def _count_daily_polls(profile, community) -> int:
+    """Count the polls a profile created in a community today"""
+    # Filter on a plain range rather than created_at__date, so the
+    # database can range scan the (profile, community, created_at) index
+    today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return Poll.objects.filter(
+        profile=profile,
+        community=community,
+        created_at__gte=today_start,
+        created_at__lt=today_start + timedelta(days=1),
+    ).count()
+
+
+def _reserve_daily_poll(key: str, profile, community) -> bool:
+    """
+    Count a new poll towards today's limit, returning False if the limit was
+    already reached.
+
+    With Redis the count is kept in the cache and incremented atomically, so
+    concurrent creates can't all slip under the limit. A per-process cache
+    would only see this worker's polls, so without Redis it is counted from
+    the database.
+    """
+    if not settings.USE_REDIS:
+        return _count_daily_polls(profile, community) < DAILY_POLL_LIMIT
+
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        # Cold cache, seed it from the database
+        cache.add(key, _count_daily_polls(profile, community), 86400)  # 24 hours
+        count = cache.incr(key)
+
+    if count > DAILY_POLL_LIMIT:
+        cache.decr(key)
+        return False
+    return True
+
+
+def _release_daily_poll(key: str) -> None:
+    """Give back a poll reserved by _reserve_daily_poll"""
+    if not settings.USE_REDIS:
+        return
+    try:
+        cache.decr(key)
+    except ValueError:
+        # Expired or evicted, the next create recounts from the database
+        pass
+
+
+# Upload helpers
+def _store_uploads(model, uploads: List[UploadedFile]) -> List[str]:
+    """
+    Save uploads under the model's image upload_to, returning their names in
+    order. Several uploads are saved concurrently since each save is a
+    network round trip to object storage.
+    """
+    image_field = model._meta.get_field("image")
+    storage = image_field.storage
+
+    # Give same-named uploads distinct names up front, so parallel saves
+    # can't both claim the same available name
+    names = []
+    for upload in uploads:
+        name = image_field.generate_filename(None, upload.name)
+        while name in names:
+            root, ext = os.path.splitext(name)
+            name = storage.get_alternative_name(root, ext)
+        names.append(name)
+
+    if len(uploads) <= 1:
+        return [storage.save(name, upload) for name, upload in zip(names, uploads)]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(uploads), MAX_UPLOAD_WORKERS)
+    ) as executor:
+        return list(executor.map(storage.save, names, uploads))
+
+
+def _delete_uploads(model, names: List[str]) -> None:
+    """Delete stored uploads of a poll that was never created"""
+    storage = model._meta.get_field("image").storage
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception as e:
+            logger.error(f"Failed to delete orphaned upload {name}: {str(e)}")
+
+
+# Tag helpers
+def _prepare_tags(tag_names: List[str]) -> Dict[str, str]:
+    """
+    Normalize tag names (stripped, lowercased, no empties or duplicates) and
+    map each one to its slug, keeping the submitted order.
+    """
+    names = dict.fromkeys(name.strip().lower() for name in tag_names if name.strip())
+    return {name: slugify(name) for name in names}
+
+
+def _find_tag_conflict(tag_slugs_by_name: Dict[str, str]) -> Optional[str]:
+    """
+    Tag names and slugs are both unique, so a new name whose slug is taken
+    by a differently named tag can't be created. Return an error message for
+    the first such name, or None.
+    """
+    names_by_slug = {}
+    for name, slug in tag_slugs_by_name.items():
+        if slug in names_by_slug:
+            return f"Tags '{names_by_slug[slug]}' and '{name}' are the same tag"
+        names_by_slug[slug] = name
+
+    conflict = (
+        Tag.objects.filter(slug__in=names_by_slug)
+        .exclude(name__in=tag_slugs_by_name)
+        .first()
+    )
+    if conflict:
+        return (
+            f"Tag '{names_by_slug[conflict.slug]}' conflicts with existing tag "
+            f"'{conflict.name}'"
+        )
+    return None
+
+
+def _upsert_tags(tag_slugs_by_name: Dict[str, str]) -> Dict[str, Tag]:
+    """
+    Get or create tags by name in two queries, returning a name to Tag map.
+    Check the names with _find_tag_conflict first; a conflicting tag created
+    concurrently raises IntegrityError rather than being silently dropped.
+    """
+    Tag.objects.bulk_create(
+        [Tag(name=name, slug=slug) for name, slug in tag_slugs_by_name.items()],
+        ignore_conflicts=True,
+    )
+    tags_by_name = Tag.objects.filter(name__in=tag_slugs_by_name).in_bulk(
+        field_name="name"
+    )
+    missing = set(tag_slugs_by_name) - set(tags_by_name)
+    if missing:
+        raise IntegrityError(f"Tag slugs already taken: {sorted(missing)}")
+    return tags_by_name
+
+
+def _add_poll_tags(poll: Poll, community, tags) -> None:
+    """Attach tags to a poll and bump their usage counts"""
+    poll_content_type = ContentType.objects.get_for_model(Poll)
+    tag_ids = [tag.id for tag in tags]
+    if not tag_ids:
+        return
+
+    # bulk_create skips TaggedItem.save(), so keep usage_count in sync here
+    TaggedItem.objects.bulk_create(
+        [
+            TaggedItem(
+                tag_id=tag_id,
+                content_type=poll_content_type,
+                object_id=poll.id,
+                community=community,
+            )
+            for tag_id in tag_ids
+        ],
+        ignore_conflicts=True,
+    )
+    Tag.objects.filter(id__in=tag_ids).update(usage_count=models.F("usage_count") + 1)
+
+
+def _remove_poll_tags(poll: Poll, tags) -> None:
+    """Detach tags from a poll and decrement their usage counts"""
+    poll_content_type = ContentType.objects.get_for_model(Poll)
+    tag_ids = [tag.id for tag in tags]
+
+    # Queryset delete skips TaggedItem.delete(), so keep usage_count in sync here
+    TaggedItem.objects.filter(
+        content_type=poll_content_type, object_id=poll.id, tag_id__in=tag_ids
+    ).delete()
+    Tag.objects.filter(id__in=tag_ids).update(usage_count=models.F("usage_count") - 1)
+
+
 # Validation helpers
 def validate_poll_images(images: List[UploadedFile]) -> tuple[bool, str]:
     """Validate uploaded images for poll options"""
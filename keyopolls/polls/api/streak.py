@@ -1,12 +1,16 @@
-from typing import List
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional
 
+from django.db.models import F, Q
 from ninja import Router
 
 from keyopolls.common.schemas import Message
 from keyopolls.communities.models import Community
 from keyopolls.polls.models import AuraTransaction, CommunityStreak
 from keyopolls.polls.schemas import (
-    AuraTransactionSchema,
+    AuraTransactionsResponseSchema,
     CommunityStreakSchema,
     CommunityStreakSummarySchema,
     StreakCalendarSchema,
@@ -29,17 +33,26 @@ def get_community_streak(request, community_id: int):
     """Get user's streak information for a specific community"""
     profile: PseudonymousProfile = request.auth
 
-    try:
-        community = Community.objects.get(id=community_id)
-    except Community.DoesNotExist:
-        return 404, {"message": "Community not found"}
+    # Load the streak together with its community, only looking up the
+    # community on its own when the user has no streak there yet
+    streak = (
+        CommunityStreak.objects.select_related("community")
+        .filter(profile=profile, community_id=community_id)
+        .first()
+    )
+    if streak:
+        community = streak.community
+    else:
+        try:
+            community = Community.objects.get(id=community_id)
+        except Community.DoesNotExist:
+            return 404, {"message": "Community not found"}
 
     # Check if user has access to this community
     if not community.can_user_access(profile):
         return 404, {"message": "Community not found"}
 
-    try:
-        streak = CommunityStreak.objects.get(profile=profile, community=community)
+    if streak:
         streak_data = {
             "community_id": community.id,
             "community_name": community.name,
@@ -56,7 +69,7 @@ def get_community_streak(request, community_id: int):
                 else None
             ),
         }
-    except CommunityStreak.DoesNotExist:
+    else:
         streak_data = {
             "community_id": community.id,
             "community_name": community.name,
@@ -121,39 +134,75 @@ def get_user_streaks(request):
 @router.get(
     "/profile/aura/transactions",
     response={
-        200: List[AuraTransactionSchema],
+        200: AuraTransactionsResponseSchema,
+        400: Message,
         404: Message,
     },
     auth=PseudonymousJWTAuth(),
 )
-def get_aura_transactions(request, limit: int = 50, offset: int = 0):
-    """Get user's aura transaction history"""
+def get_aura_transactions(request, limit: int = 50, cursor: Optional[str] = None):
+    """Get user's aura transaction history, newest first"""
     profile: PseudonymousProfile = request.auth
+    limit = min(max(1, limit), 100)  # Limit between 1-100
+
+    transactions = AuraTransaction.objects.filter(profile=profile)
+
+    # Keyset pagination: continue after the last transaction of the previous
+    # page so deep pages cost the same as the first one
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = _decode_transaction_cursor(cursor)
+        except ValueError:
+            return 400, {"message": "Invalid cursor"}
+        transactions = transactions.filter(
+            Q(created_at__lt=cursor_created_at)
+            | Q(created_at=cursor_created_at, id__lt=cursor_id)
+        )
 
-    transactions = (
-        AuraTransaction.objects.filter(profile=profile)
-        .select_related("poll", "community")
-        .order_by("-created_at")[offset : offset + limit]
+    # Project only the columns the response needs, joining poll/community
+    # for their titles instead of loading full model instances. One extra row
+    # is fetched to tell whether there is a next page.
+    transactions = list(
+        transactions.order_by("-created_at", "-id").values(
+            "id",
+            "transaction_type",
+            "amount",
+            "description",
+            "poll_id",
+            "community_id",
+            "created_at",
+            poll_title=F("poll__title"),
+            community_name=F("community__name"),
+        )[: limit + 1]
     )
 
-    transaction_data = []
-    for transaction in transactions:
-        transaction_data.append(
-            {
-                "id": transaction.id,
-                "transaction_type": transaction.transaction_type,
-                "amount": transaction.amount,
-                "description": transaction.description,
-                "poll_id": transaction.poll.id if transaction.poll else None,
-                "poll_title": transaction.poll.title if transaction.poll else None,
-                "community_id": (
-                    transaction.community.id if transaction.community else None
-                ),
-                "community_name": (
-                    transaction.community.name if transaction.community else None
-                ),
-                "created_at": transaction.created_at.isoformat(),
-            }
-        )
+    next_cursor = None
+    if len(transactions) > limit:
+        transactions = transactions[:limit]
+        if transactions:
+            last = transactions[-1]
+            next_cursor = _encode_transaction_cursor(last["created_at"], last["id"])
+
+    transaction_data = [
+        {**transaction, "created_at": transaction["created_at"].isoformat()}
+        for transaction in transactions
+    ]
+
+    return 200, {"transactions": transaction_data, "next_cursor": next_cursor}
+
+
+def _encode_transaction_cursor(created_at, transaction_id):
+    """Encode a (created_at, id) position as an opaque URL-safe cursor"""
+    raw = f"{created_at.isoformat()}|{transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_transaction_cursor(cursor):
+    """Decode a cursor into (created_at, id), raising ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Malformed cursor") from e
 
-    return 200, transaction_data
+    created_at, _, transaction_id = raw.partition("|")
+    return datetime.fromisoformat(created_at), int(transaction_id)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from keyopolls.polls.models import Poll
+
+
+class Command(BaseCommand):
+    help = "Close active polls whose expiry has passed. Run this from cron"
+
+    def handle(self, *args, **options):
+        closed_count = Poll.close_expired()
+        self.stdout.write(self.style.SUCCESS(f"Closed {closed_count} expired polls"))
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand
+
+from keyopolls.polls.models import Poll
+from keyopolls.polls.services.general import count_correct_voters
+
+# Polls read per chunk
+CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount correct voters from votes and text responses, repairing "
+        "Poll.correct_voter_count where it has drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-id",
+            type=int,
+            action="append",
+            dest="poll_ids",
+            help="Only recount this poll (can be repeated)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted counters without fixing them",
+        )
+
+    def handle(self, *args, **options):
+        poll_ids = options["poll_ids"]
+        dry_run = options["dry_run"]
+
+        polls = Poll.objects.filter(has_correct_answer=True).prefetch_related("options")
+        if poll_ids:
+            polls = polls.filter(id__in=poll_ids)
+
+        checked = 0
+        repaired = 0
+        skipped = 0
+        for poll in polls.iterator(chunk_size=CHUNK_SIZE):
+            checked += 1
+            correct_count = count_correct_voters(poll)
+            if correct_count == poll.correct_voter_count:
+                continue
+
+            if not dry_run:
+                # Votes bump the counter with F() increments, so only write
+                # the recount if no vote landed since this poll was read
+                updated = Poll.objects.filter(
+                    id=poll.id, correct_voter_count=poll.correct_voter_count
+                ).update(correct_voter_count=correct_count)
+                if not updated:
+                    skipped += 1
+                    self.stdout.write(
+                        f"Poll {poll.id}: changed while recounting, skipped"
+                    )
+                    continue
+
+            repaired += 1
+            self.stdout.write(
+                f"Poll {poll.id}: correct_voter_count "
+                f"{poll.correct_voter_count} -> {correct_count}"
+            )
+
+        action = "would be repaired" if dry_run else "repaired"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} polls, {repaired} {action}, "
+                f"{skipped} skipped (rerun to recount them)"
+            )
+        )
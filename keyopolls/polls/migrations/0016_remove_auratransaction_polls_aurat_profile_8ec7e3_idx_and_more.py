@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0015_poll_poll_list_delete_polllistitem"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="auratransaction",
+            name="polls_aurat_profile_8ec7e3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="auratransaction",
+            index=models.Index(
+                fields=["profile", "-created_at", "-id"],
+                name="polls_aurat_profile_6e9e51_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        (
+            "polls",
+            "0016_remove_auratransaction_polls_aurat_profile_8ec7e3_idx_and_more",
+        ),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                fields=["profile", "community", "created_at"],
+                name="polls_poll_profile_ee6a7e_idx",
+            ),
+        ),
+    ]
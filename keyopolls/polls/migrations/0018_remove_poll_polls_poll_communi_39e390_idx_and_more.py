@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0017_poll_polls_poll_profile_ee6a7e_idx"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_communi_39e390_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_is_dele_73e3aa_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_status_5e706a_idx",
+        ),
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["community", "status", "-created_at"],
+                name="poll_active_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["community", "is_pinned", "-created_at"],
+                name="poll_pinned_feed_idx",
+            ),
+        ),
+    ]
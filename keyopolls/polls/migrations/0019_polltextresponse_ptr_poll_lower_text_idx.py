@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:01
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0018_remove_poll_polls_poll_communi_39e390_idx_and_more"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="polltextresponse",
+            index=models.Index(
+                models.F("poll"),
+                django.db.models.functions.text.Lower("text_value"),
+                name="ptr_poll_lower_text_idx",
+            ),
+        ),
+    ]
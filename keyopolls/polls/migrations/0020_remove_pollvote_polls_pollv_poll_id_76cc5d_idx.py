@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0019_polltextresponse_ptr_poll_lower_text_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="pollvote",
+            name="polls_pollv_poll_id_76cc5d_idx",
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0020_remove_pollvote_polls_pollv_poll_id_76cc5d_idx"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False), ("status", "active")),
+                fields=["community", "-created_at"],
+                include=(
+                    "title",
+                    "total_votes",
+                    "total_voters",
+                    "profile",
+                    "poll_type",
+                ),
+                name="poll_feed_covering_idx",
+            ),
+        ),
+    ]
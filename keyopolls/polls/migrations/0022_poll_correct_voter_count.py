@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:08
+
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def count_correct_voters(poll):
+    """Count the voters of a poll who answered correctly, from its votes"""
+    if poll.poll_type == "text_input":
+        if not poll.correct_text_answer:
+            return 0
+        return (
+            poll.text_responses.alias(lower_text_value=Lower("text_value"))
+            .filter(lower_text_value=poll.correct_text_answer.lower())
+            .count()
+        )
+
+    if poll.poll_type == "ranking":
+        if not poll.correct_ranking_order:
+            return 0
+        correct_ranks = models.Q()
+        for rank, option_id in enumerate(poll.correct_ranking_order, 1):
+            correct_ranks |= models.Q(rank=rank, option_id=option_id)
+        return (
+            poll.votes.values("profile")
+            .annotate(
+                correct_ranks=models.Count("rank", filter=correct_ranks, distinct=True)
+            )
+            .filter(correct_ranks=len(poll.correct_ranking_order))
+            .count()
+        )
+
+    correct_option_ids = list(
+        poll.options.filter(is_correct=True).values_list("id", flat=True)
+    )
+    if not correct_option_ids:
+        return 0
+
+    if poll.poll_type == "single":
+        return (
+            poll.votes.filter(option_id__in=correct_option_ids)
+            .values("profile")
+            .distinct()
+            .count()
+        )
+
+    # Multiple choice: voters who selected exactly all correct options
+    return (
+        poll.votes.values("profile")
+        .annotate(
+            selected=models.Count("option", distinct=True),
+            selected_correct=models.Count(
+                "option",
+                filter=models.Q(option_id__in=correct_option_ids),
+                distinct=True,
+            ),
+        )
+        .filter(
+            selected=len(correct_option_ids),
+            selected_correct=len(correct_option_ids),
+        )
+        .count()
+    )
+
+
+def backfill_correct_voter_count(apps, schema_editor):
+    Poll = apps.get_model("polls", "Poll")
+    polls = Poll.objects.filter(has_correct_answer=True, total_voters__gt=0)
+    for poll in polls.iterator():
+        poll.correct_voter_count = count_correct_voters(poll)
+        poll.save(update_fields=["correct_voter_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0021_poll_poll_feed_covering_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="poll",
+            name="correct_voter_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_correct_voter_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0022_poll_correct_voter_count"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="polltextresponse",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("text_value__contains", " "), _negated=True),
+                name="ptr_no_space",
+            ),
+        ),
+    ]
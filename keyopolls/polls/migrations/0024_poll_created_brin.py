@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_created_brin(apps, schema_editor):
+    # BRIN is PostgreSQL only, other backends keep using the btree indexes
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS poll_created_brin ON polls_poll "
+        "USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_created_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS poll_created_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0023_polltextresponse_ptr_no_space"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_created_brin, drop_created_brin),
+    ]
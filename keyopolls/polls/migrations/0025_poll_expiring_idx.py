@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0024_poll_created_brin"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_expires_0c4433_idx",
+        ),
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                condition=models.Q(("expires_at__isnull", False), ("status", "active")),
+                fields=["expires_at"],
+                name="poll_expiring_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0025_poll_expiring_idx"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="pollvote",
+            name="polls_pollv_profile_ee69d0_idx",
+        ),
+        migrations.AddIndex(
+            model_name="pollvote",
+            index=models.Index(
+                fields=["profile", "-created_at"],
+                include=("poll", "option"),
+                name="pollvote_profile_cover_idx",
+            ),
+        ),
+    ]
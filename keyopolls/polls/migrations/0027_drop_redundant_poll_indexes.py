@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0026_pollvote_profile_cover_idx"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_unique__0b60c3_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="poll",
+            name="polls_poll_slug_3e2bd9_idx",
+        ),
+        migrations.AlterField(
+            model_name="poll",
+            name="community",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="polls",
+                to="communities.community",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="poll",
+            name="profile",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="polls",
+                to="profile.pseudonymousprofile",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0027_drop_redundant_poll_indexes"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="communitystreak",
+            options={},
+        ),
+        migrations.RemoveIndex(
+            model_name="communitystreak",
+            name="polls_commu_profile_4a8909_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="communitystreak",
+            name="polls_commu_communi_769e6e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="communitystreak",
+            index=models.Index(
+                fields=["community", "-current_streak"],
+                include=("profile", "max_streak", "last_activity_date"),
+                name="cs_leaderboard",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0028_communitystreak_leaderboard"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="poll",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False), ("status", "active")),
+                fields=["-created_at"],
+                name="poll_global_active_feed_idx",
+            ),
+        ),
+    ]
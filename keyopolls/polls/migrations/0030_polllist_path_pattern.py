@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communities", "0005_alter_communitymembership_role"),
+        ("polls", "0029_poll_global_active_feed_idx"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="polllist",
+            name="polls_polll_path_4a5649_idx",
+        ),
+        migrations.AddIndex(
+            model_name="polllist",
+            index=models.Index(
+                fields=["path"],
+                name="polllist_path_pattern",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
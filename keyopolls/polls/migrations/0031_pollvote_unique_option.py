@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:37
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_votes(apps, schema_editor):
+    """Keep the first of any repeated (poll, profile, option) votes"""
+    Poll = apps.get_model("polls", "Poll")
+    PollOption = apps.get_model("polls", "PollOption")
+    PollVote = apps.get_model("polls", "PollVote")
+
+    duplicates = (
+        PollVote.objects.values("poll", "profile", "option")
+        .annotate(keep_id=models.Min("id"), copies=models.Count("id"))
+        .filter(copies__gt=1)
+    )
+    poll_ids = set()
+    for group in duplicates.iterator():
+        PollVote.objects.filter(
+            poll_id=group["poll"],
+            profile_id=group["profile"],
+            option_id=group["option"],
+        ).exclude(id=group["keep_id"]).delete()
+        poll_ids.add(group["poll"])
+
+    if not poll_ids:
+        return
+
+    # Each duplicate was counted when it was cast, so recount the polls it hit
+    option_votes = (
+        PollVote.objects.filter(option=models.OuterRef("pk"))
+        .values("option")
+        .annotate(count=models.Count("id"))
+        .values("count")
+    )
+    PollOption.objects.filter(poll_id__in=poll_ids).update(
+        vote_count=Coalesce(models.Subquery(option_votes), 0)
+    )
+    for poll in Poll.objects.filter(id__in=poll_ids).iterator():
+        votes = PollVote.objects.filter(poll_id=poll.id)
+        total_voters = votes.values("profile").distinct().count()
+        # Ranking polls count a ballot as one vote
+        if poll.poll_type == "ranking":
+            total_votes = total_voters
+        else:
+            total_votes = votes.count()
+        Poll.objects.filter(id=poll.id).update(
+            total_votes=total_votes, total_voters=total_voters
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0030_polllist_path_pattern"),
+        ("profile", "0004_pseudonymousprofile_total_aura"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_votes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="pollvote",
+            constraint=models.UniqueConstraint(
+                fields=("poll", "profile", "option"), name="pollvote_unique_option"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="pollvote",
+            name="polls_pollv_poll_id_37e927_idx",
+        ),
+    ]
@@ -1,6 +1,10 @@
+import re
+from functools import cached_property
+
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -43,6 +47,14 @@ class Poll(models.Model, ImpressionTrackingMixin):
         ("archived", "Archived"),
     ]
 
+    # Status groups for visibility and moderation checks
+    HIDDEN_STATUSES = frozenset(("draft", "pending_moderation", "rejected"))
+    MODERATION_STATUSES = frozenset(("pending_moderation", "rejected"))
+    FINISHED_STATUSES = frozenset(("closed", "archived"))
+
+    # Saves retried when a generated slug is taken concurrently
+    SLUG_SAVE_ATTEMPTS = 3
+
     # Basic fields
     id = models.BigAutoField(primary_key=True)
 
@@ -81,16 +93,21 @@ class Poll(models.Model, ImpressionTrackingMixin):
         max_length=20, choices=STATUS_CHOICES, default="pending_moderation"
     )
 
-    # Author
+    # Author and community lookups use the (profile, -created_at) and
+    # (community, -created_at) indexes, so neither needs its own index
     profile = models.ForeignKey(
         "profile.PseudonymousProfile",
         on_delete=models.CASCADE,
         related_name="polls",
+        db_index=False,
     )
 
     # Community (polls are always part of a community)
     community = models.ForeignKey(
-        "communities.Community", on_delete=models.CASCADE, related_name="polls"
+        "communities.Community",
+        on_delete=models.CASCADE,
+        related_name="polls",
+        db_index=False,
     )
 
     poll_list = models.ForeignKey(
@@ -125,6 +142,9 @@ class Poll(models.Model, ImpressionTrackingMixin):
     # Denormalized counts for performance
     total_votes = models.PositiveIntegerField(default=0)
     total_voters = models.PositiveIntegerField(default=0)  # Unique voters
+    correct_voter_count = models.PositiveIntegerField(
+        default=0
+    )  # Voters who answered correctly
     option_count = models.PositiveIntegerField(default=0)
 
     # Engagement metrics
@@ -141,8 +161,11 @@ class Poll(models.Model, ImpressionTrackingMixin):
     moderated_at = models.DateTimeField(null=True, blank=True)
 
     # Generic relations for comments, reactions, etc.
+    # Serializers read the comment_count/like_count/dislike_count counters
+    # above, these relations are only for listing the related rows
     comments = GenericRelation("comments.GenericComment")
     reactions = GenericRelation("common.Reaction")
+    tagged_items = GenericRelation("common.TaggedItem")
 
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now)
@@ -154,17 +177,55 @@ class Poll(models.Model, ImpressionTrackingMixin):
     class Meta:
         indexes = [
             models.Index(fields=["profile", "-created_at"]),
+            models.Index(fields=["profile", "community", "created_at"]),
             models.Index(fields=["community", "-created_at"]),
-            models.Index(fields=["community", "is_pinned", "-created_at"]),
             models.Index(fields=["status", "-created_at"]),
             models.Index(fields=["poll_type", "-created_at"]),
-            models.Index(fields=["expires_at"]),
+            # total_votes descending, so ORDER BY ... LIMIT reads the index
+            # in order without a sort step
             models.Index(fields=["-total_votes"]),
-            models.Index(fields=["is_deleted", "status"]),
-            models.Index(fields=["status", "community", "-created_at"]),
-            # New indexes for unique_id and slug
-            models.Index(fields=["unique_id"]),
-            models.Index(fields=["slug"]),
+            # Only active polls with an expiry can be closed by close_expired,
+            # so the index skips every row without one
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(status="active", expires_at__isnull=False),
+                name="poll_expiring_idx",
+            ),
+            # Feed indexes only cover polls that haven't been soft deleted,
+            # which is what nearly every poll query filters on
+            models.Index(
+                fields=["community", "status", "-created_at"],
+                condition=models.Q(is_deleted=False),
+                name="poll_active_feed_idx",
+            ),
+            models.Index(
+                fields=["community", "is_pinned", "-created_at"],
+                condition=models.Q(is_deleted=False),
+                name="poll_pinned_feed_idx",
+            ),
+            # Covers the active community feed, carrying the listed columns
+            # so the feed can be paged with an index-only scan (PostgreSQL)
+            models.Index(
+                fields=["community", "-created_at"],
+                include=[
+                    "title",
+                    "total_votes",
+                    "total_voters",
+                    "profile",
+                    "poll_type",
+                ],
+                condition=models.Q(is_deleted=False, status="active"),
+                name="poll_feed_covering_idx",
+            ),
+            # Same rows for feeds across all communities
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_deleted=False, status="active"),
+                name="poll_global_active_feed_idx",
+            ),
+            # unique_id and slug are indexed by their unique constraints
+            # Wide created_at range scans (archival, reindexing) use the BRIN
+            # index poll_created_brin, created on PostgreSQL by migration 0024
         ]
         ordering = ["-created_at"]
 
@@ -173,36 +234,56 @@ class Poll(models.Model, ImpressionTrackingMixin):
 
     def save(self, *args, **kwargs):
         """Override save to generate unique_id and slug"""
-        # Generate unique unique_id if not provided
+        # 66 random bits make a unique_id collision vanishingly unlikely, so
+        # it is left to the unique index instead of being checked up front
         if not self.unique_id:
-            max_attempts = 10
-            for _ in range(max_attempts):
-                new_id = generate_youtube_like_id()
-                if not Poll.objects.filter(unique_id=new_id).exists():
-                    self.unique_id = new_id
-                    break
-            else:
-                # If we couldn't generate a unique ID after max_attempts
-                raise ValueError(
-                    f"Could not generate unique unique_id after {max_attempts} attempts"
-                )
+            self.unique_id = generate_youtube_like_id()
 
-        # Generate slug if not provided
-        if not self.slug:
-            base_slug = slugify(self.title)[:90]  # Reserve space for counter suffix
-            slug = base_slug
-            counter = 1
-
-            # Ensure slug uniqueness and length limit
-            while Poll.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                suffix = f"-{counter}"
-                max_base_length = 100 - len(suffix)
-                slug = f"{base_slug[:max_base_length]}{suffix}"
-                counter += 1
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
 
-            self.slug = slug
+        # Generate slug if not provided. Titles without any Latin letters or
+        # digits slugify to nothing, so fall back to the poll's unique_id
+        # rather than searching every slug for a free one.
+        base_slug = slugify(self.title)[:90]  # Reserve space for counter suffix
+        if not base_slug:
+            base_slug = slugify(self.unique_id)
+        for attempt in range(self.SLUG_SAVE_ATTEMPTS):
+            self.slug = self._next_free_slug(base_slug)
+            try:
+                # Savepoint, so a slug taken by a concurrent save since it
+                # was picked can be retried
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                slug_taken = (
+                    Poll.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                )
+                if not slug_taken or attempt + 1 == self.SLUG_SAVE_ATTEMPTS:
+                    raise
+
+    def _next_free_slug(self, base_slug):
+        """Find the first free slug among base_slug, base_slug-1, ... in one query"""
+        taken = set(
+            Poll.objects.filter(
+                slug__startswith=base_slug,
+                slug__regex=rf"^{re.escape(base_slug)}(-[0-9]+)?$",
+            )
+            .exclude(pk=self.pk)
+            .values_list("slug", flat=True)
+        )
 
-        super().save(*args, **kwargs)
+        # Ensure slug uniqueness and length limit
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            suffix = f"-{counter}"
+            max_base_length = 100 - len(suffix)
+            slug = f"{base_slug[:max_base_length]}{suffix}"
+            counter += 1
+        return slug
 
     def clean(self):
         """Validate model constraints"""
@@ -231,48 +312,63 @@ class Poll(models.Model, ImpressionTrackingMixin):
     @property
     def is_active(self):
         """Check if poll is active and not expired"""
-        if self.status != "active":
-            return False
-        if self.expires_at and timezone.now() > self.expires_at:
-            return False
-        return True
+        return self.is_active_at(timezone.now())
+
+    def is_active_at(self, now):
+        """
+        Check if poll is active and not expired at the given time, so
+        callers checking many polls can read the clock once.
+        """
+        return self.status == "active" and not self.is_expired_at(now)
 
     @property
     def is_expired(self):
         """Check if poll has expired"""
-        return self.expires_at and timezone.now() > self.expires_at
+        return self.is_expired_at(timezone.now())
 
-    def can_vote(self, profile):
+    def is_expired_at(self, now):
+        """Check if poll has expired at the given time (see is_active_at)"""
+        return self.expires_at is not None and now > self.expires_at
+
+    def can_vote(self, profile, now=None):
         """Check if profile can vote on this poll"""
-        if not self.is_active:
+        if not self.is_active_at(now or timezone.now()):
             return False
         if self.requires_aura > 0 and profile.total_aura < self.requires_aura:
             return False
 
         # Check membership for private, restricted, or public communities
         if self.community.community_type in ["private", "restricted", "public"]:
-            try:
-                membership = self.community.memberships.get(profile=profile)
-                if not membership.is_active_member:
-                    return False
-            except CommunityMembership.DoesNotExist:
-                return False
+            return CommunityMembership.is_active_member_cached(
+                self.community_id, profile.id
+            )
 
         return True
 
+    @classmethod
+    def bulk_increment(cls, poll_id, votes_delta, voters_delta=0, correct_delta=0):
+        """Add to a poll's vote, voter and correct voter counts in one UPDATE"""
+        cls.objects.filter(pk=poll_id).update(
+            total_votes=models.F("total_votes") + votes_delta,
+            total_voters=models.F("total_voters") + voters_delta,
+            correct_voter_count=models.F("correct_voter_count") + correct_delta,
+        )
+
+    @classmethod
+    def close_expired(cls, now=None):
+        """Close every active poll whose expiry has passed, returning the count"""
+        now = now or timezone.now()
+        return cls.objects.filter(
+            status="active", expires_at__isnull=False, expires_at__lt=now
+        ).update(status="closed", updated_at=now)
+
     def increment_vote_count(self, is_new_voter=False):
-        """Increment vote counts efficiently"""
-        self.total_votes = models.F("total_votes") + 1
-        if is_new_voter:
-            self.total_voters = models.F("total_voters") + 1
-        self.save(update_fields=["total_votes", "total_voters"])
+        """Increment vote counts with a single UPDATE (skips save())"""
+        Poll.bulk_increment(self.pk, 1, voters_delta=int(is_new_voter))
 
     def decrement_vote_count(self, is_removing_voter=False):
-        """Decrement vote counts efficiently"""
-        self.total_votes = models.F("total_votes") - 1
-        if is_removing_voter:
-            self.total_voters = models.F("total_voters") - 1
-        self.save(update_fields=["total_votes", "total_voters"])
+        """Decrement vote counts with a single UPDATE (skips save())"""
+        Poll.bulk_increment(self.pk, -1, voters_delta=-int(is_removing_voter))
 
     def approve_poll(self):
         """Approve the poll after successful moderation"""
@@ -287,65 +383,26 @@ class Poll(models.Model, ImpressionTrackingMixin):
         self.moderated_at = timezone.now()
         self.save(update_fields=["status", "moderation_reason", "moderated_at"])
 
+    @cached_property
+    def correct_option_ids(self):
+        """
+        IDs of the correct options, taken from prefetched options when the
+        poll was loaded with them so no extra query is needed.
+        """
+        if "options" in getattr(self, "_prefetched_objects_cache", {}):
+            return tuple(
+                option.id for option in self.options.all() if option.is_correct
+            )
+        return tuple(self.options.filter(is_correct=True).values_list("id", flat=True))
+
     def get_correct_answer_stats(self):
         """Get statistics about correct answers"""
         if not self.has_correct_answer or self.total_voters == 0:
             return {"correct_count": 0, "correct_percentage": 0.0}
 
-        correct_count = 0
-
-        if self.poll_type == "single":
-            # Count votes for the correct option
-            correct_option = self.options.filter(is_correct=True).first()
-            if correct_option:
-                correct_count = (
-                    correct_option.votes.values("profile").distinct().count()
-                )
-
-        elif self.poll_type == "multiple":
-            # Count users who selected exactly all correct options
-            correct_option_ids = set(
-                self.options.filter(is_correct=True).values_list("id", flat=True)
-            )
-            if correct_option_ids:
-                # Get users and their selected option IDs
-                user_votes = {}
-                for vote in self.votes.all():
-                    if vote.profile_id not in user_votes:
-                        user_votes[vote.profile_id] = set()
-                    user_votes[vote.profile_id].add(vote.option_id)
-
-                # Count users who selected exactly the correct options
-                for user_options in user_votes.values():
-                    if user_options == correct_option_ids:
-                        correct_count += 1
-
-        elif self.poll_type == "ranking":
-            # Count users who ranked in the correct order
-            if self.correct_ranking_order:
-                correct_order = self.correct_ranking_order
-                user_votes = {}
-                for vote in self.votes.all():
-                    if vote.profile_id not in user_votes:
-                        user_votes[vote.profile_id] = {}
-                    user_votes[vote.profile_id][vote.rank] = vote.option_id
-
-                # Check each user's ranking
-                for user_rankings in user_votes.values():
-                    user_order = [
-                        user_rankings.get(rank)
-                        for rank in range(1, len(correct_order) + 1)
-                    ]
-                    if user_order == correct_order:
-                        correct_count += 1
-
-        elif self.poll_type == "text_input":
-            # Count text responses that match the correct answer
-            correct_count = self.text_responses.filter(
-                text_value__iexact=self.correct_text_answer
-            ).count()
-
-        correct_percentage = round((correct_count / self.total_voters) * 100, 1)
+        # Maintained by cast_vote alongside the other vote counters
+        correct_count = self.correct_voter_count
+        correct_percentage = PollOption.pct(correct_count, self.total_voters)
         return {
             "correct_count": correct_count,
             "correct_percentage": correct_percentage,
@@ -393,20 +450,36 @@ class PollOption(models.Model):
 
     @property
     def vote_percentage(self):
-        """Calculate vote percentage for this option"""
-        if self.poll.total_votes == 0:
-            return 0
-        return round((self.vote_count / self.poll.total_votes) * 100, 1)
+        """
+        Calculate vote percentage for this option. Reads `self.poll`, so
+        callers already holding the poll should use `pct` with its totals.
+        """
+        return self.pct(self.vote_count, self.poll.total_votes)
+
+    @staticmethod
+    def pct(count, total):
+        """
+        Percentage of `count` in `total` rounded to one decimal, using integer
+        math for the division and rounding.
+        """
+        if not total:
+            return 0.0
+        return (count * 1000 + total // 2) // total / 10
+
+    @classmethod
+    def bulk_increment(cls, option_ids, delta=1):
+        """Add `delta` votes to each of the given options in a single UPDATE"""
+        cls.objects.filter(id__in=option_ids).update(
+            vote_count=models.F("vote_count") + delta
+        )
 
     def increment_vote_count(self):
-        """Increment vote count efficiently"""
-        self.vote_count = models.F("vote_count") + 1
-        self.save(update_fields=["vote_count"])
+        """Increment vote count with a single UPDATE (skips save())"""
+        PollOption.bulk_increment([self.pk])
 
     def decrement_vote_count(self):
-        """Decrement vote count efficiently"""
-        self.vote_count = models.F("vote_count") - 1
-        self.save(update_fields=["vote_count"])
+        """Decrement vote count with a single UPDATE (skips save())"""
+        PollOption.bulk_increment([self.pk], delta=-1)
 
 
 class PollVote(models.Model):
@@ -432,13 +505,25 @@ class PollVote(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["poll", "profile"]),
+            # (poll, profile) lookups use the pollvote_unique_option index
             models.Index(fields=["option", "-created_at"]),
-            models.Index(fields=["profile", "-created_at"]),
-            models.Index(fields=["poll", "option", "profile"]),  # For quick lookups
+            # Carries the voted poll and option, so a profile's votes (like the
+            # feed's voted filter) are read with an index-only scan (PostgreSQL)
+            models.Index(
+                fields=["profile", "-created_at"],
+                include=["poll", "option"],
+                name="pollvote_profile_cover_idx",
+            ),
+        ]
+        # Multiple choice and ranking ballots hold several votes per user,
+        # but never two for the same option. One ballot per user and poll is
+        # enforced by PollAnswerResult being unique per poll and profile.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["poll", "profile", "option"],
+                name="pollvote_unique_option",
+            ),
         ]
-        # Allow multiple votes per user for multiple choice and ranking
-        # Uniqueness is enforced at the application level based on poll type
 
     def __str__(self):
         rank_str = f" (Rank {self.rank})" if self.rank else ""
@@ -472,8 +557,19 @@ class PollTextResponse(models.Model):
             models.Index(fields=["poll", "text_value"]),
             models.Index(fields=["poll", "profile"]),
             models.Index(fields=["profile", "-created_at"]),
+            # Case-insensitive answer matching when recounting correct voters
+            models.Index(
+                models.F("poll"),
+                Lower("text_value"),
+                name="ptr_poll_lower_text_idx",
+            ),
         ]
         unique_together = ["poll", "profile"]  # One response per user per poll
+        constraints = [
+            models.CheckConstraint(
+                condition=~models.Q(text_value__contains=" "), name="ptr_no_space"
+            ),
+        ]
 
     def clean(self):
         """Validate text input"""
@@ -486,9 +582,10 @@ class PollTextResponse(models.Model):
             )
 
     def save(self, *args, **kwargs):
-        # Clean and validate the text value
+        # Clean and validate the text value. Only the checks from clean() run
+        # here, field limits and uniqueness are enforced by the database.
         self.text_value = self.text_value.strip()
-        self.full_clean()
+        self.clean()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -534,40 +631,37 @@ class PollTextAggregate(models.Model):
             return
 
         # Get current counts from responses
-        from django.db.models import Count
-
-        response_counts = (
+        response_counts = list(
             poll.text_responses.values("text_value")
-            .annotate(count=Count("text_value"))
+            .annotate(count=models.Count("text_value"))
             .values_list("text_value", "count")
         )
 
-        # Update or create aggregates
-        existing_aggregates = {
-            agg.text_value: agg for agg in cls.objects.filter(poll=poll)
-        }
-
-        for text_value, count in response_counts:
-            if text_value in existing_aggregates:
-                agg = existing_aggregates[text_value]
-                if agg.response_count != count:
-                    agg.response_count = count
-                    agg.save(update_fields=["response_count", "updated_at"])
-            else:
-                cls.objects.create(
-                    poll=poll, text_value=text_value, response_count=count
-                )
+        # No savepoint needed, callers run this inside the vote transaction
+        with transaction.atomic(savepoint=False):
+            # Upsert the counts with INSERT ... ON CONFLICT, one statement per
+            # thousand distinct answers
+            cls.objects.bulk_create(
+                [
+                    cls(poll=poll, text_value=text_value, response_count=count)
+                    for text_value, count in response_counts
+                ],
+                update_conflicts=True,
+                unique_fields=["poll", "text_value"],
+                update_fields=["response_count", "updated_at"],
+                batch_size=1000,
+            )
 
-        # Remove aggregates that no longer have responses
-        current_values = {text_value for text_value, _ in response_counts}
-        cls.objects.filter(poll=poll).exclude(text_value__in=current_values).delete()
+            # Remove aggregates that no longer have responses
+            current_values = [text_value for text_value, _ in response_counts]
+            cls.objects.filter(poll=poll).exclude(
+                text_value__in=current_values
+            ).delete()
 
     @property
     def percentage(self):
         """Calculate percentage of total responses"""
-        if self.poll.total_voters == 0:
-            return 0
-        return round((self.response_count / self.poll.total_voters) * 100, 1)
+        return PollOption.pct(self.response_count, self.poll.total_voters)
 
 
 class PollTodo(models.Model):
@@ -606,13 +700,13 @@ class PollTodo(models.Model):
         """Mark todo as completed"""
         self.is_completed = True
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=["is_completed", "completed_at"])
 
     def mark_incomplete(self):
         """Mark todo as incomplete"""
         self.is_completed = False
         self.completed_at = None
-        self.save()
+        self.save(update_fields=["is_completed", "completed_at"])
 
 
 # NEW MODELS FOR ANSWER TRACKING AND STREAKS
@@ -702,7 +796,7 @@ class AuraTransaction(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["profile", "-created_at"]),
+            models.Index(fields=["profile", "-created_at", "-id"]),
             models.Index(fields=["transaction_type", "-created_at"]),
             models.Index(fields=["poll", "-created_at"]),
             models.Index(fields=["community", "-created_at"]),
@@ -746,13 +840,17 @@ class CommunityStreak(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["profile", "community"]),
-            models.Index(fields=["community", "-current_streak"]),
+            # Community leaderboard, read with an index-only scan (PostgreSQL)
+            models.Index(
+                fields=["community", "-current_streak"],
+                include=["profile", "max_streak", "last_activity_date"],
+                name="cs_leaderboard",
+            ),
             models.Index(fields=["community", "-max_streak"]),
             models.Index(fields=["profile", "-current_streak"]),
         ]
+        # (profile, community) lookups use the unique_together index
         unique_together = ["profile", "community"]
-        ordering = ["-current_streak"]
 
     def __str__(self):
         return (
@@ -840,10 +938,46 @@ class CommunityStreakActivity(models.Model):
             f"({self.date}): {self.polls_answered} polls"
         )
 
-    def check_target_met(self):
-        """Check if daily target is met and update accordingly"""
-        if self.polls_answered >= 5 and not self.target_met:
-            self.target_met = True
-            self.save(update_fields=["target_met", "updated_at"])
-            return True
-        return False
+    @classmethod
+    def record_poll_answer(cls, profile, community, activity_date, daily_target):
+        """
+        Count one answered poll towards the day's activity, returning the
+        activity and whether this answer met the daily target. The count and
+        target_met change in one UPDATE, so concurrent answers neither lose
+        counts nor both meet the target.
+        """
+        activities = cls.objects.filter(
+            profile=profile, community=community, date=activity_date
+        )
+        updated = activities.update(
+            polls_answered=models.F("polls_answered") + 1,
+            # Compared against the count before this increment
+            target_met=models.Case(
+                models.When(
+                    polls_answered__gte=daily_target - 1, then=models.Value(True)
+                ),
+                default=models.F("target_met"),
+                output_field=models.BooleanField(),
+            ),
+            updated_at=timezone.now(),
+        )
+
+        if updated:
+            activity = activities.get()
+        else:
+            try:
+                # Savepoint, a concurrent first answer may create it first
+                with transaction.atomic():
+                    activity = cls.objects.create(
+                        profile=profile,
+                        community=community,
+                        date=activity_date,
+                        polls_answered=1,
+                        target_met=daily_target <= 1,
+                    )
+            except IntegrityError:
+                return cls.record_poll_answer(
+                    profile, community, activity_date, daily_target
+                )
+
+        return activity, activity.polls_answered == daily_target
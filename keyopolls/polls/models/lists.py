@@ -1,11 +1,20 @@
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Substr
 from django.utils import timezone
 from django.utils.text import slugify
 
 from keyopolls.utils import generate_youtube_like_id
 
+COUNT_FIELDS = [
+    "direct_polls_count",
+    "total_polls_count",
+    "direct_folders_count",
+    "total_items_count",
+]
+
 
 class PollList(models.Model):
     """
@@ -139,7 +148,13 @@ class PollList(models.Model):
             models.Index(fields=["profile", "-created_at"]),
             models.Index(fields=["community", "-created_at"]),
             models.Index(fields=["parent", "order"]),
-            models.Index(fields=["path"]),
+            # Descendant lookups are path LIKE 'prefix%' queries, which a
+            # plain btree only serves under the C collation
+            models.Index(
+                fields=["path"],
+                name="polllist_path_pattern",
+                opclasses=["varchar_pattern_ops"],
+            ),
             models.Index(fields=["visibility", "-created_at"]),
             models.Index(fields=["list_type", "-created_at"]),
             models.Index(fields=["is_featured", "-created_at"]),
@@ -159,30 +174,41 @@ class PollList(models.Model):
 
     def save(self, *args, **kwargs):
         """Override save to generate unique_id, slug, and update tree fields"""
-        # Generate unique unique_id if not provided
+        # Generate unique unique_id if not provided, checking every candidate
+        # for collisions in a single query
         if not self.unique_id:
             max_attempts = 10
-            for _ in range(max_attempts):
-                new_id = generate_youtube_like_id()
-                if not PollList.objects.filter(unique_id=new_id).exists():
-                    self.unique_id = new_id
-                    break
-            else:
+            candidates = [generate_youtube_like_id() for _ in range(max_attempts)]
+            taken = set(
+                PollList.objects.filter(unique_id__in=candidates).values_list(
+                    "unique_id", flat=True
+                )
+            )
+            self.unique_id = next((c for c in candidates if c not in taken), None)
+            if not self.unique_id:
                 raise ValueError(
                     f"Could not generate unique unique_id after {max_attempts} attempts"
                 )
 
-        # Generate slug if not provided
+        # Generate slug if not provided, looking up suffixes ten at a time
         if not self.slug:
             base_slug = slugify(self.title)[:90]
-            slug = base_slug
-            counter = 1
-
-            while PollList.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                suffix = f"-{counter}"
-                max_base_length = 100 - len(suffix)
-                slug = f"{base_slug[:max_base_length]}{suffix}"
-                counter += 1
+            counter = 0
+            slug = None
+
+            while not slug:
+                candidates = []
+                for n in range(counter, counter + 10):
+                    suffix = f"-{n}" if n else ""
+                    max_base_length = 100 - len(suffix)
+                    candidates.append(f"{base_slug[:max_base_length]}{suffix}")
+                taken = set(
+                    PollList.objects.filter(slug__in=candidates)
+                    .exclude(pk=self.pk)
+                    .values_list("slug", flat=True)
+                )
+                slug = next((c for c in candidates if c not in taken), None)
+                counter += 10
 
             self.slug = slug
 
@@ -200,17 +226,13 @@ class PollList(models.Model):
         """Validate model constraints"""
         # Prevent circular references
         if self.parent:
-            if self.parent == self:
+            if self.pk and self.parent_id == self.pk:
                 raise ValidationError("A list cannot be its own parent")
 
-            # Check for circular reference in ancestors
-            current = self.parent
-            while current:
-                if current == self:
-                    raise ValidationError(
-                        "Circular reference detected in parent hierarchy"
-                    )
-                current = current.parent
+            # The parent's materialized path lists all of its ancestor ids,
+            # so a cycle shows up there without walking the chain
+            if self.pk and str(self.pk) in self.parent.path.strip("/").split("/"):
+                raise ValidationError("Circular reference detected in parent hierarchy")
 
         # Validate depth limit (prevent too deep nesting)
         if self.depth > 10:  # Configurable limit
@@ -234,16 +256,16 @@ class PollList(models.Model):
 
     def get_ancestors(self):
         """Get all ancestors from root to parent"""
-        if not self.parent:
-            return PollList.objects.none()
+        if not self.parent_id or not self.path:
+            return []
 
-        # Parse path to get ancestor IDs
-        if self.path:
-            ancestor_ids = [
-                int(id_str) for id_str in self.path.strip("/").split("/") if id_str
-            ]
-            return PollList.objects.filter(id__in=ancestor_ids).order_by("depth")
-        return PollList.objects.none()
+        # The path lists ancestor IDs root first, so fetch them in one query
+        # and keep that order rather than sorting by depth
+        ancestor_ids = [
+            int(id_str) for id_str in self.path.strip("/").split("/") if id_str
+        ]
+        ancestors = PollList.objects.in_bulk(ancestor_ids)
+        return [ancestors[id_] for id_ in ancestor_ids if id_ in ancestors]
 
     def get_descendants(self):
         """Get all descendants (children, grandchildren, etc.)"""
@@ -257,43 +279,60 @@ class PollList(models.Model):
 
     def get_breadcrumbs(self):
         """Get breadcrumb navigation"""
-        breadcrumbs = list(self.get_ancestors())
-        breadcrumbs.append(self)
-        return breadcrumbs
+        return [*self.get_ancestors(), self]
 
     def update_counts(self):
         """Update denormalized counts"""
-        # Direct polls count
-        self.direct_polls_count = self.poll_list.filter(is_deleted=False).count()
-
-        # Direct folders count
-        self.direct_folders_count = self.children.filter(
-            list_type="folder", is_deleted=False
-        ).count()
-
-        # Total polls count (including nested)
-        descendant_poll_counts = (
-            self.get_descendants().aggregate(total=models.Sum("direct_polls_count"))[
-                "total"
-            ]
-            or 0
+        PollList.recount_lists(PollList.objects.filter(pk=self.pk))
+        self.refresh_from_db(fields=COUNT_FIELDS)
+
+    @classmethod
+    def recount_lists(cls, queryset):
+        """
+        Recompute the denormalized counts of every list in queryset in one
+        UPDATE, using subqueries correlated on each list's id and path.
+        """
+        from keyopolls.polls.models import Poll
+
+        def count(qs, group_by, aggregate=None):
+            # Group on a column shared by every matched row so the subquery
+            # returns a single aggregated value
+            aggregate = aggregate or Count("pk")
+            return Coalesce(
+                Subquery(
+                    qs.order_by().values(group_by).annotate(n=aggregate).values("n")
+                ),
+                0,
+            )
+
+        direct_polls = count(
+            Poll.objects.filter(poll_list=OuterRef("pk"), is_deleted=False),
+            "poll_list",
         )
-        self.total_polls_count = self.direct_polls_count + descendant_poll_counts
-
-        # Total items count
-        self.total_items_count = (
-            self.direct_polls_count
-            + self.direct_folders_count
-            + self.get_descendants().count()
+        direct_folders = count(
+            cls.objects.filter(
+                parent=OuterRef("pk"), list_type="folder", is_deleted=False
+            ),
+            "parent",
+        )
+        descendants = cls.objects.filter(
+            path__startswith=Concat(
+                OuterRef("path"),
+                Cast(OuterRef("pk"), output_field=models.CharField()),
+                Value("/"),
+                output_field=models.CharField(),
+            ),
+            is_deleted=False,
         )
 
-        self.save(
-            update_fields=[
-                "direct_polls_count",
-                "total_polls_count",
-                "direct_folders_count",
-                "total_items_count",
-            ]
+        return queryset.update(
+            direct_polls_count=direct_polls,
+            direct_folders_count=direct_folders,
+            total_polls_count=direct_polls
+            + count(descendants, "is_deleted", Sum("direct_polls_count")),
+            total_items_count=direct_polls
+            + direct_folders
+            + count(descendants, "is_deleted"),
         )
 
     def can_add_polls(self, profile):
@@ -319,6 +358,9 @@ class PollList(models.Model):
         if new_parent and new_parent.community != self.community:
             raise ValidationError("Cannot move list to different community")
 
+        old_prefix = f"{self.path}{self.id}/"
+        old_depth = self.depth
+
         self.parent = new_parent
         if new_order is not None:
             self.order = new_order
@@ -326,9 +368,17 @@ class PollList(models.Model):
         self.full_clean()  # This will update path and depth
         self.save()
 
-        # Update all descendants' paths
-        for descendant in self.get_descendants():
-            descendant.save()  # This will recalculate path
+        # Rewrite every descendant's path prefix and depth in one UPDATE
+        new_prefix = f"{self.path}{self.id}/"
+        if new_prefix != old_prefix:
+            PollList.objects.filter(path__startswith=old_prefix).update(
+                path=Concat(
+                    Value(new_prefix),
+                    Substr("path", len(old_prefix) + 1),
+                    output_field=models.CharField(),
+                ),
+                depth=F("depth") + (self.depth - old_depth),
+            )
 
 
 class PollListCollaborator(models.Model):
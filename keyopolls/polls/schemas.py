@@ -1,12 +1,21 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch
+from django.utils import timezone
 from ninja import Schema
 
 from keyopolls.common.models import Bookmark, Reaction, TaggedItem
 from keyopolls.common.schemas import PaginationSchema
-from keyopolls.polls.models import Poll, PollTodo, PollVote
+from keyopolls.polls.models import (
+    Poll,
+    PollOption,
+    PollTextResponse,
+    PollTodo,
+    PollVote,
+)
 from keyopolls.polls.services import (
     calculate_multiple_choice_distribution,
     calculate_option_ranking_results,
@@ -64,6 +73,138 @@ class PollCreateSchema(Schema):
 
     tags: Optional[List[str]] = None  # Tags for categorization
 
+    @cached_property
+    def option_orders(self) -> FrozenSet[int]:
+        """Distinct display orders of the submitted options"""
+        return frozenset(option.order for option in self.options)
+
+    def validation_error(self) -> Optional[str]:
+        """
+        Check the payload rules, returning the first error message or None.
+        Views return it as a 400, which is the error shape clients expect.
+        """
+        validate_poll_type = _POLL_TYPE_VALIDATORS.get(self.poll_type)
+        if validate_poll_type is None:
+            return "Invalid poll type"
+        return validate_poll_type(self) or _validate_common(self)
+
+
+def _validate_option_count(data: "PollCreateSchema") -> Optional[str]:
+    """Option-based polls need between 2 and 10 options"""
+    if len(data.options) < 2:
+        return "Poll must have at least 2 options"
+    if len(data.options) > 10:  # Increased limit
+        return "Poll cannot have more than 10 options"
+    return None
+
+
+def _validate_correct_options(data: "PollCreateSchema") -> Optional[str]:
+    """Choice polls with correct answers need at least one correct option"""
+    if not data.has_correct_answer:
+        return None
+
+    correct_count = sum(opt.is_correct for opt in data.options)
+    if not correct_count:
+        return (
+            f"{data.poll_type.title()} choice polls with correct "
+            "answers must have at least one correct option"
+        )
+    if data.poll_type == "single" and correct_count > 1:
+        return "Single choice polls can only have one correct option"
+    return None
+
+
+def _validate_single(data: "PollCreateSchema") -> Optional[str]:
+    return _validate_option_count(data) or _validate_correct_options(data)
+
+
+def _validate_multiple(data: "PollCreateSchema") -> Optional[str]:
+    error = _validate_option_count(data)
+    if error:
+        return error
+    if data.max_choices and data.max_choices > len(data.options):
+        return "max_choices cannot exceed number of options"
+    return _validate_correct_options(data)
+
+
+def _validate_ranking(data: "PollCreateSchema") -> Optional[str]:
+    error = _validate_option_count(data)
+    if error or not data.has_correct_answer:
+        return error
+
+    if not data.correct_ranking_order:
+        return "Ranking polls with correct answers must specify correct_ranking_order"
+    if len(data.correct_ranking_order) != len(data.options):
+        return "Correct ranking order must include all options"
+    # Validate that all option orders are included
+    if frozenset(data.correct_ranking_order) != data.option_orders:
+        return "Correct ranking order must include all option orders exactly once"
+    return None
+
+
+def _validate_text_input(data: "PollCreateSchema") -> Optional[str]:
+    # Don't validate multiple votes settings for text input - we'll ignore them
+    if data.options:
+        return "Text input polls cannot have predefined options"
+    if not data.has_correct_answer:
+        return None
+
+    if not data.correct_text_answer:
+        return "Text input polls with correct answers must specify correct_text_answer"
+    if " " in data.correct_text_answer.strip():
+        return "Correct text answer cannot contain spaces"
+    return None
+
+
+# Per poll type validators, each returning an error message or None
+_POLL_TYPE_VALIDATORS: Dict[str, Callable[["PollCreateSchema"], Optional[str]]] = {
+    "single": _validate_single,
+    "multiple": _validate_multiple,
+    "ranking": _validate_ranking,
+    "text_input": _validate_text_input,
+}
+
+
+def _validate_common(data: "PollCreateSchema") -> Optional[str]:
+    """Validate the fields shared by every poll type"""
+    # Validate explanation field (mandatory)
+    if not data.explanation or len(data.explanation.strip()) < 250:
+        return "Explanation must be at least 250 characters"
+
+    # Validate todos
+    if data.todos:
+        if len(data.todos) > 5:
+            return "Cannot create more than 5 todos per poll"
+
+        for todo in data.todos:
+            if not todo.text or len(todo.text.strip()) == 0:
+                return "Todo text cannot be empty"
+            if len(todo.text.strip()) > 400:
+                return "Todo text cannot exceed 400 characters"
+
+    return _validate_tags(data.tags)
+
+
+def _validate_tags(tags: Optional[List[str]]) -> Optional[str]:
+    """Validate poll tags, shared by poll creation and updates"""
+    if not tags:
+        return None
+
+    if len(tags) > 5:  # Limit to 5 tags max
+        return "Poll cannot have more than 5 tags"
+
+    # Validate each tag
+    for tag_name in tags:
+        if not tag_name or len(tag_name.strip()) == 0:
+            return "Tag name cannot be empty"
+        if len(tag_name.strip()) > 50:
+            return "Tag name cannot exceed 50 characters"
+        # Check for valid characters (letters, numbers, hyphens, underscores)
+        if not tag_name.replace("-", "").replace("_", "").replace(" ", "").isalnum():
+            return f"Tag '{tag_name}' contains invalid characters"
+
+    return None
+
 
 class PollUpdateSchema(Schema):
     title: str
@@ -71,6 +212,14 @@ class PollUpdateSchema(Schema):
     tags: Optional[List[str]] = None  # Tags for categorization
     explanation: Optional[str] = None  # Explanation for correct answers (optional)
 
+    def validation_error(self) -> Optional[str]:
+        """Check the payload rules, returning the first error message or None"""
+        if not self.title.strip():
+            return "Title cannot be empty"
+        if self.explanation is not None and len(self.explanation.strip()) < 250:
+            return "Explanation must be at least 250 characters"
+        return _validate_tags(self.tags)
+
 
 # Vote Input Schemas
 class VoteData(Schema):
@@ -151,7 +300,7 @@ class PollOptionSchema(Schema):
             "image_url": option.image.url if option.image else None,
             "order": option.order,
             "vote_count": option.vote_count,
-            "vote_percentage": option.vote_percentage,
+            "vote_percentage": PollOption.pct(option.vote_count, poll.total_votes),
             "is_correct": option.is_correct,
         }
 
@@ -285,20 +434,59 @@ class PollDetails(Schema):
     user_votes: List[UserVoteDetails] = []  # For option-based polls
     user_text_response: Optional[UserTextResponse] = None  # For text input polls
 
+    # Images still being attached by a background worker
+    image_pending: bool = False
+
     # Timestamps
     created_at: datetime
     updated_at: datetime
 
+    @staticmethod
+    def with_related(queryset, profile=None):
+        """
+        Load everything `resolve` walks in a fixed number of queries.
+        Pass the viewing profile to also load their own votes and text
+        responses, instead of `resolve` looking them up poll by poll.
+        """
+        queryset = queryset.select_related(
+            "profile", "community", "poll_list"
+        ).prefetch_related(
+            "options",
+            "todos",
+            Prefetch("tagged_items", queryset=TaggedItem.objects.select_related("tag")),
+        )
+        if profile:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "votes",
+                    queryset=PollVote.objects.filter(profile=profile),
+                    to_attr="viewer_votes",
+                ),
+                Prefetch(
+                    "text_responses",
+                    queryset=PollTextResponse.objects.filter(profile=profile),
+                    to_attr="viewer_text_responses",
+                ),
+            )
+        return queryset
+
     @staticmethod
     def resolve_list(polls, profile=None):
         """
         Resolve a list of polls.
         """
-        return [PollDetails.resolve(poll, profile) for poll in polls]
+        now = timezone.now()
+        return [PollDetails.resolve(poll, profile, now) for poll in polls]
 
     @staticmethod
-    def resolve(poll: Poll, profile: Optional[PseudonymousProfile] = None):
+    def resolve(
+        poll: Poll,
+        profile: Optional[PseudonymousProfile] = None,
+        now: Optional[datetime] = None,
+    ):
         """Resolve poll data with optional user context"""
+        now = now or timezone.now()
+        is_active = poll.is_active_at(now)
 
         # Initialize user-specific fields
         user_can_vote = False
@@ -313,46 +501,50 @@ class PollDetails(Schema):
         # Set user context if profile provided
         if profile:
             is_author = poll.profile.id == profile.id
-            user_can_vote = poll.can_vote(profile)
+            user_can_vote = is_active and poll.can_vote(profile, now)
 
             user_reactions = Reaction.get_user_reactions(profile, poll)
             is_bookmarked = Bookmark.is_bookmarked(profile, poll)
 
-            # Check if user has voted based on poll type
+            # Check if user has voted based on poll type, using the votes
+            # `with_related` prefetched for this profile when available
             if poll.poll_type == "text_input":
-                try:
-                    text_response = poll.text_responses.get(profile=profile)
+                if hasattr(poll, "viewer_text_responses"):
+                    text_response = next(iter(poll.viewer_text_responses), None)
+                else:
+                    text_response = poll.text_responses.filter(profile=profile).first()
+                if text_response:
                     user_has_voted = True
                     user_text_response = {
                         "text_value": text_response.text_value,
                         "responded_at": text_response.created_at,
                     }
-                except poll.text_responses.model.DoesNotExist:
-                    user_has_voted = False
             else:
                 # Get user's votes for option-based polls
-                user_poll_votes = PollVote.objects.filter(
-                    poll=poll, profile=profile
-                ).select_related("option")
-                user_has_voted = user_poll_votes.exists()
+                if hasattr(poll, "viewer_votes"):
+                    user_poll_votes = poll.viewer_votes
+                else:
+                    user_poll_votes = list(
+                        PollVote.objects.filter(poll=poll, profile=profile)
+                    )
+                user_has_voted = bool(user_poll_votes)
 
                 # Extract user vote details
-                if user_has_voted:
-                    user_votes = [
-                        {
-                            "option_id": vote.option.id,
-                            "rank": vote.rank,
-                            "voted_at": vote.created_at,
-                        }
-                        for vote in user_poll_votes
-                    ]
+                user_votes = [
+                    {
+                        "option_id": vote.option_id,
+                        "rank": vote.rank,
+                        "voted_at": vote.created_at,
+                    }
+                    for vote in user_poll_votes
+                ]
 
         # Determine if we should show results
         show_results = (
             user_has_voted  # User has voted
             or is_author  # User is the author
-            or poll.status in ["closed", "archived"]  # Poll is finished
-            or not poll.is_active  # Poll is not active
+            or poll.status in Poll.FINISHED_STATUSES  # Poll is finished
+            or not is_active  # Poll is not active
         )
 
         # Get correct answer stats if applicable
@@ -377,7 +569,9 @@ class PollDetails(Schema):
                     {
                         "text_value": agg.text_value,
                         "response_count": agg.response_count,
-                        "percentage": agg.percentage,
+                        "percentage": PollOption.pct(
+                            agg.response_count, poll.total_voters
+                        ),
                         "is_correct": (
                             (
                                 poll.has_correct_answer
@@ -395,7 +589,7 @@ class PollDetails(Schema):
             if show_results:
                 options_data = [
                     PollOptionSchema.resolve_with_results(option, poll)
-                    for option in poll.options.all().order_by("order")
+                    for option in poll.options.all()
                 ]
 
                 # Add multiple choice distribution stats
@@ -405,27 +599,49 @@ class PollDetails(Schema):
                         {
                             "choice_count": choice_count,
                             "user_count": user_count,
-                            "percentage": (
-                                round((user_count / poll.total_voters) * 100, 1)
-                                if poll.total_voters > 0
-                                else 0
-                            ),
+                            "percentage": PollOption.pct(user_count, poll.total_voters),
                         }
                         for choice_count, user_count in sorted(distribution.items())
                     ]
             else:
                 options_data = [
                     PollOptionSchema.resolve_without_results(option)
-                    for option in poll.options.all().order_by("order")
+                    for option in poll.options.all()
                 ]
 
-        poll_content_type = ContentType.objects.get_for_model(poll)
-        tagged_items = TaggedItem.objects.filter(
-            content_type=poll_content_type, object_id=poll.id
-        ).select_related("tag")
+        # Use prefetched tags when available (see `PollDetails.with_related`)
+        if "tagged_items" in getattr(poll, "_prefetched_objects_cache", {}):
+            tagged_items = poll.tagged_items.all()
+        else:
+            poll_content_type = ContentType.objects.get_for_model(poll)
+            tagged_items = TaggedItem.objects.filter(
+                content_type=poll_content_type, object_id=poll.id
+            ).select_related("tag")
 
         tags_data = [tagged_item.tag.slug for tagged_item in tagged_items]
 
+        return {
+            **PollDetails._poll_fields(poll, is_active, tags_data, poll.todos.all()),
+            "correct_answer_stats": correct_answer_stats,
+            "options": options_data,
+            "text_responses": text_responses_data,
+            "multiple_choice_stats": multiple_choice_stats_data,
+            "user_can_vote": user_can_vote,
+            "user_has_voted": user_has_voted,
+            "user_reactions": user_reactions,
+            "is_bookmarked": is_bookmarked,
+            "is_author": is_author,
+            "show_results": show_results,
+            "user_votes": user_votes,
+            "user_text_response": user_text_response,
+        }
+
+    @staticmethod
+    def _poll_fields(poll: Poll, is_active: bool, tags: List[str], todos):
+        """
+        Fields read straight off the poll, its author and its community,
+        shared by `resolve` and `resolve_created`.
+        """
         return {
             "id": poll.id,
             "title": poll.title,
@@ -434,7 +650,7 @@ class PollDetails(Schema):
             "image_url": poll.image.url if poll.image else None,
             "poll_type": poll.poll_type,
             "status": poll.status,
-            "tags": tags_data,  # Returns list of tag slugs
+            "tags": tags,  # List of tag slugs
             "author_username": poll.profile.username,
             "author_display_name": poll.profile.display_name,
             "author_avatar": (poll.profile.avatar.url if poll.profile.avatar else None),
@@ -445,21 +661,20 @@ class PollDetails(Schema):
             "community_avatar": (
                 poll.community.avatar.url if poll.community.avatar else None
             ),
-            "poll_list_id": poll.poll_list.id if poll.poll_list else None,
+            "poll_list_id": poll.poll_list_id,
             "allow_multiple_votes": poll.allow_multiple_votes,
             "max_choices": poll.max_choices,
             "requires_aura": poll.requires_aura,
             "is_pinned": poll.is_pinned,
-            "todos": [TodoItemSchema.resolve(todo) for todo in poll.todos.all()],
+            "todos": [TodoItemSchema.resolve(todo) for todo in todos],
             "has_correct_answer": poll.has_correct_answer,
-            "correct_answer_stats": correct_answer_stats,
             "correct_ranking_order": (
                 poll.correct_ranking_order if poll.poll_type == "ranking" else None
             ),
             "correct_text_answer": (
                 poll.correct_text_answer if poll.poll_type == "text_input" else None
             ),
-            "is_active": poll.is_active,
+            "is_active": is_active,
             "total_votes": poll.total_votes,
             "total_voters": poll.total_voters,
             "option_count": poll.option_count,
@@ -469,21 +684,82 @@ class PollDetails(Schema):
             "dislike_count": poll.dislike_count,
             "share_count": poll.share_count,
             "comment_count": poll.comment_count,
-            "options": options_data,
-            "text_responses": text_responses_data,
-            "multiple_choice_stats": multiple_choice_stats_data,
-            "user_can_vote": user_can_vote,
-            "user_has_voted": user_has_voted,
-            "user_reactions": user_reactions,
-            "is_bookmarked": is_bookmarked,
-            "is_author": is_author,
-            "show_results": show_results,
-            "user_votes": user_votes,
-            "user_text_response": user_text_response,
             "created_at": poll.created_at,
             "updated_at": poll.updated_at,
         }
 
+    @classmethod
+    def resolve_fast(cls, poll: Poll, profile: Optional[PseudonymousProfile] = None):
+        """
+        Resolve poll data into an unvalidated `PollDetails`.
+
+        The data comes straight from the ORM, so validating it again on
+        construction is skipped. Load the poll through `with_related` so
+        no relation is fetched lazily.
+        """
+        return cls.model_construct(**cls.resolve(poll, profile))
+
+    @classmethod
+    def resolve_created(
+        cls,
+        poll: Poll,
+        options: List,
+        todos: List[PollTodo],
+        tags: List[str],
+        user_can_vote: bool,
+        image_pending: bool = False,
+    ):
+        """
+        Resolve a freshly created poll from the objects already in memory.
+
+        A new poll has no votes, reactions or bookmarks yet and the requester
+        is its author, so none of the per-user lookups done by `resolve`
+        are needed. Like `resolve_fast`, the result is left unvalidated.
+
+        With `image_pending`, uploaded images are still being attached by
+        `attach_poll_images_task` and image URLs are left empty.
+        """
+        options_data = []
+        for option in options:
+            option_data = {
+                "id": option.id,
+                "text": option.text,
+                "image_url": option.image.url if option.image else None,
+                "order": option.order,
+                "vote_count": 0,
+                "vote_percentage": 0.0,
+                "is_correct": option.is_correct,
+            }
+            if poll.poll_type == "ranking":
+                option_data["best_rank"] = None
+                option_data["best_rank_percentage"] = 0.0
+            options_data.append(option_data)
+
+        # The poll was created with its author and community, so they are
+        # already loaded, and its counters are all still zero
+        data = {
+            **cls._poll_fields(poll, poll.is_active, tags, todos),
+            "correct_answer_stats": (
+                {"correct_count": 0, "correct_percentage": 0.0}
+                if poll.has_correct_answer
+                else None
+            ),
+            "options": options_data,
+            "text_responses": [],
+            "multiple_choice_stats": [],
+            "user_can_vote": user_can_vote,
+            "user_has_voted": False,
+            "user_reactions": {r_type: False for r_type, _ in Reaction.REACTION_TYPES},
+            "is_bookmarked": False,
+            "is_author": True,
+            "show_results": True,
+            "user_votes": [],
+            "user_text_response": None,
+            "image_pending": image_pending,
+        }
+
+        return cls.model_construct(**data)
+
 
 class PollListResponseSchema(Schema):
     items: List[PollDetails]
@@ -553,6 +829,13 @@ class AuraTransactionSchema(Schema):
     created_at: str  # ISO datetime string
 
 
+class AuraTransactionsResponseSchema(Schema):
+    """A page of aura transactions with the cursor for the next one"""
+
+    transactions: List[AuraTransactionSchema]
+    next_cursor: Optional[str] = None
+
+
 """
 Poll List Schemas
 """
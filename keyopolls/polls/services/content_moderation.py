@@ -2,16 +2,29 @@ import base64
 import io
 import json
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import anthropic
 from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
+from django.db import models, transaction
 from PIL import Image
 
+from keyopolls.communities.models import Community
+from keyopolls.polls.models import Poll
+from keyopolls.utils.contentUtils import increment_aura
+
 logger = logging.getLogger(__name__)
 
 
+class ModerationServiceError(Exception):
+    """Exception raised when the moderation API can't evaluate content."""
+
+    pass
+
+
 class ContentModerationService:
     def __init__(self):
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
@@ -36,8 +49,16 @@ class ContentModerationService:
 
         Returns:
             Tuple of (is_appropriate, reason, detailed_analysis)
+
+        Raises:
+            ModerationServiceError: if the moderation API call fails
         """
 
+        # Reject obvious violations locally before paying for a model call
+        banned_terms = find_banned_terms(f"{poll_title} {poll_description}")
+        if banned_terms:
+            return False, f"Contains banned terms: {', '.join(banned_terms)}", {}
+
         try:
             # Process images if provided
             processed_images = []
@@ -71,8 +92,9 @@ class ContentModerationService:
 
         except Exception as e:
             logger.error(f"Error calling Claude API: {str(e)}")
-            # Fallback to reject content if API fails (safer approach)
-            return False, f"Moderation service error: {str(e)}", {}
+            # An outage says nothing about the content, so leave the decision
+            # to the caller instead of rejecting it
+            raise ModerationServiceError(str(e)) from e
 
     def _process_images(self, images: List[UploadedFile]) -> List[Dict]:
         """Process and validate uploaded images"""
@@ -261,3 +283,68 @@ Please respond in the following JSON format:
             logger.error(f"Response text: {response_text}")
             # Default to rejection if we can't parse
             return False, "Unable to parse moderation response", {}
+
+
+def find_banned_terms(text: str) -> List[str]:
+    """Return the distinct banned terms found in text, in order of appearance"""
+    pattern = _banned_terms_pattern(tuple(settings.MODERATION_BANNED_TERMS))
+    if pattern is None:
+        return []
+    return list(dict.fromkeys(match.lower() for match in pattern.findall(text)))
+
+
+@lru_cache(maxsize=8)
+def _banned_terms_pattern(terms: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile the banned terms into a single whole-word regex, once per list"""
+    if not terms:
+        return None
+    # Longest first, so a term wins over any of its own prefixes
+    alternatives = "|".join(
+        re.escape(term) for term in sorted(set(terms), key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)", re.IGNORECASE)
+
+
+def moderate_poll(
+    poll: Poll, option_images: Optional[List[UploadedFile]] = None
+) -> Optional[Poll]:
+    """
+    Run content moderation on a pending poll and approve or reject it.
+
+    The poll should come with its community and the community's category
+    loaded. The moderation API call happens outside any transaction; the
+    status change, the community poll count update and, on approval, the
+    author's creation aura are written atomically, so a failed aura award
+    leaves the poll pending to be moderated again. So does a
+    ModerationServiceError from the moderation API, which is raised to the
+    caller. Returns the moderated poll, or None if it was no longer pending.
+    """
+    if poll.status != "pending_moderation":
+        return None
+
+    community = poll.community
+    category = community.category
+    is_approved, reason, _ = ContentModerationService().evaluate_poll_content(
+        poll_title=poll.title,
+        poll_description=poll.description,
+        community_name=community.name,
+        community_description=community.description,
+        community_rules=community.rules,
+        category_name=category.name if category else "",
+        category_description=category.description if category else "",
+        community_type=community.community_type,
+        option_images=option_images,
+    )
+
+    with transaction.atomic():
+        if not is_approved:
+            poll.reject_poll(reason)
+            logger.info(f"Poll {poll.id} rejected by moderation: {reason}")
+            return poll
+
+        poll.approve_poll()
+        Community.objects.filter(pk=community.pk).update(
+            poll_count=models.F("poll_count") + 1
+        )
+        increment_aura(poll.profile, "polls", 1)
+    return poll
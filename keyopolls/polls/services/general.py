@@ -1,6 +1,7 @@
 from typing import List
 
-from django.db.models import Count
+from django.db.models import Count, Q
+from django.db.models.functions import Lower
 
 from keyopolls.polls.models import Poll, PollOption, PollVote
 
@@ -102,7 +103,7 @@ def calculate_option_ranking_results(option: PollOption, poll: Poll):
     # Find the rank with the highest count
     best_rank = max(rank_counts.keys(), key=lambda r: rank_counts[r])
     best_count = rank_counts[best_rank]
-    best_percentage = round((best_count / poll.total_voters) * 100, 1)
+    best_percentage = PollOption.pct(best_count, poll.total_voters)
 
     return {"best_rank": best_rank, "best_rank_percentage": best_percentage}
 
@@ -118,8 +119,7 @@ def calculate_rank_breakdown(option: PollOption, poll: Poll):
     for vote_data in votes:
         rank = vote_data["rank"]
         count = vote_data["count"]
-        percentage = round((count / poll.total_voters) * 100, 1)
-        rank_breakdown[rank] = percentage
+        rank_breakdown[rank] = PollOption.pct(count, poll.total_voters)
 
     return rank_breakdown
 
@@ -174,7 +174,7 @@ def get_text_input_results(poll: Poll, show_correct_answers: bool = False):
             {
                 "text_value": agg.text_value,
                 "response_count": agg.response_count,
-                "percentage": agg.percentage,
+                "percentage": PollOption.pct(agg.response_count, poll.total_voters),
                 "is_correct": is_correct,
             }
         )
@@ -191,3 +191,63 @@ def calculate_poll_accuracy(poll):
         return {"correct_count": 0, "correct_percentage": 0.0}
 
     return poll.get_correct_answer_stats()
+
+
+def count_correct_voters(poll):
+    """
+    Count the voters of a poll who answered correctly, straight from its
+    votes and text responses. This is the slow path behind the
+    `correct_voter_count` counter, used to repair it.
+    """
+    if not poll.has_correct_answer:
+        return 0
+
+    if poll.poll_type == "text_input":
+        if not poll.correct_text_answer:
+            return 0
+        return (
+            poll.text_responses.alias(lower_text_value=Lower("text_value"))
+            .filter(lower_text_value=poll.correct_text_answer.lower())
+            .count()
+        )
+
+    if poll.poll_type == "ranking":
+        if not poll.correct_ranking_order:
+            return 0
+        correct_ranks = Q()
+        for rank, option_id in enumerate(poll.correct_ranking_order, 1):
+            correct_ranks |= Q(rank=rank, option_id=option_id)
+        return (
+            poll.votes.values("profile")
+            .annotate(correct_ranks=Count("rank", filter=correct_ranks, distinct=True))
+            .filter(correct_ranks=len(poll.correct_ranking_order))
+            .count()
+        )
+
+    correct_option_ids = poll.correct_option_ids
+    if not correct_option_ids:
+        return 0
+
+    if poll.poll_type == "single":
+        return (
+            poll.votes.filter(option_id__in=correct_option_ids)
+            .values("profile")
+            .distinct()
+            .count()
+        )
+
+    # Multiple choice: voters who selected exactly all correct options
+    return (
+        poll.votes.values("profile")
+        .annotate(
+            selected=Count("option", distinct=True),
+            selected_correct=Count(
+                "option", filter=Q(option_id__in=correct_option_ids), distinct=True
+            ),
+        )
+        .filter(
+            selected=len(correct_option_ids),
+            selected_correct=len(correct_option_ids),
+        )
+        .count()
+    )
@@ -56,20 +56,17 @@ class StreakService:
                 return False
 
             # Get the correct option
-            correct_option = poll.options.filter(is_correct=True).first()
-            if not correct_option:
+            if not poll.correct_option_ids:
                 return False
 
-            return user_votes[0]["option_id"] == correct_option.id
+            return user_votes[0]["option_id"] == poll.correct_option_ids[0]
 
         elif poll.poll_type == "multiple":
             if not user_votes:
                 return False
 
             # Get all correct option IDs
-            correct_option_ids = set(
-                poll.options.filter(is_correct=True).values_list("id", flat=True)
-            )
+            correct_option_ids = set(poll.correct_option_ids)
             user_option_ids = set(vote["option_id"] for vote in user_votes)
 
             # Must select exactly all correct options
@@ -122,9 +119,10 @@ class StreakService:
             community=poll.community,
         )
 
-        # Update user's total aura
-        profile.total_aura = F("total_aura") + aura_amount
-        profile.save(update_fields=["total_aura"])
+        # Update user's total aura in a single UPDATE (skips save())
+        PseudonymousProfile.objects.filter(pk=profile.pk).update(
+            total_aura=F("total_aura") + aura_amount
+        )
 
         return aura_amount
 
@@ -147,22 +145,12 @@ class StreakService:
             activity_date = date.today()
 
         with transaction.atomic():
-            # Get or create streak activity for this date
-            activity, created = CommunityStreakActivity.objects.get_or_create(
-                profile=profile,
-                community=community,
-                date=activity_date,
-                defaults={"polls_answered": 0},
+            # Count the answer, checking if the target is met for the first
+            # time today
+            activity, target_just_met = CommunityStreakActivity.record_poll_answer(
+                profile, community, activity_date, cls.DAILY_POLL_TARGET
             )
 
-            # Increment poll count
-            activity.polls_answered = F("polls_answered") + 1
-            activity.save(update_fields=["polls_answered", "updated_at"])
-            activity.refresh_from_db()
-
-            # Check if target is met for the first time today
-            target_just_met = activity.check_target_met()
-
             if target_just_met:
                 # Update the streak
                 cls._update_streak_record(profile, community, activity_date)
@@ -304,32 +292,34 @@ class StreakService:
         Returns:
             list: List of streak summaries for each community
         """
+        # Project just the summary columns (joining the community name)
+        # instead of instantiating streak and community models
         streaks = (
             CommunityStreak.objects.filter(profile=profile)
-            .select_related("community")
             .order_by("-current_streak")
+            .values(
+                "community_id",
+                "current_streak",
+                "max_streak",
+                "last_activity_date",
+                community_name=F("community__name"),
+            )
         )
 
+        today = date.today()
         summary = []
         for streak in streaks:
+            last_activity_date = streak["last_activity_date"]
             summary.append(
                 {
-                    "community_id": streak.community.id,
-                    "community_name": streak.community.name,
-                    "current_streak": (
-                        streak.current_streak if streak.current_streak else 0
-                    ),
-                    "max_streak": streak.max_streak if streak.max_streak else 0,
+                    "community_id": streak["community_id"],
+                    "community_name": streak["community_name"],
+                    "current_streak": streak["current_streak"] or 0,
+                    "max_streak": streak["max_streak"] or 0,
                     "last_activity_date": (
-                        streak.last_activity_date.isoformat()
-                        if streak.last_activity_date
-                        else None
-                    ),
-                    "is_active": (
-                        streak.last_activity_date == date.today()
-                        if streak.last_activity_date
-                        else False
+                        last_activity_date.isoformat() if last_activity_date else None
                     ),
+                    "is_active": last_activity_date == today,
                 }
             )
 
@@ -374,7 +364,7 @@ class StreakService:
             streak_info = cls.update_community_streak(profile, poll.community)
 
             # Refresh profile to get updated aura
-            profile.refresh_from_db()
+            profile.refresh_from_db(fields=["total_aura"])
 
             return {
                 "is_correct": is_correct,
@@ -0,0 +1,157 @@
+import logging
+import mimetypes
+
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from PIL import Image
+
+from keyopolls.polls.models import Poll, PollOption
+from keyopolls.polls.services.content_moderation import moderate_poll
+from keyopolls.profile.models import PseudonymousProfile
+from keyopolls.utils.contentUtils import increment_aura
+
+logger = logging.getLogger(__name__)
+
+
+# === POLL CREATION TASKS ===
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def finalize_poll_creation_task(self, poll_id, profile_id):
+    """Async task to award poll creation aura once the poll is committed"""
+    try:
+        profile = PseudonymousProfile.objects.get(id=profile_id)
+        aura_result = increment_aura(profile, "polls", 1)
+        logger.info(
+            f"Aura incremented for user {profile_id} after poll "
+            f"{poll_id} creation: {aura_result}"
+        )
+        return {"success": True, "poll_id": poll_id}
+    except PseudonymousProfile.DoesNotExist:
+        logger.error(f"Profile {profile_id} does not exist")
+        return {"success": False, "error": "Profile not found"}
+    except Exception as exc:
+        logger.error(f"Finalize poll creation task failed for {poll_id}: {str(exc)}")
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=60 * (2**self.request.retries), exc=exc)
+        return {"success": False, "error": str(exc)}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def attach_poll_images_task(self, poll_id, images):
+    """
+    Async task to verify stored poll images and attach them.
+
+    `images` is a list of [option_id, stored_name] pairs, where option_id is
+    None for the poll's own image (text input polls).
+    """
+    try:
+        poll_image = None
+        option_images = {}
+        for option_id, name in images:
+            if not _is_valid_image(name):
+                logger.warning(f"Discarding invalid image {name} for poll {poll_id}")
+                default_storage.delete(name)
+                continue
+
+            if option_id is None:
+                poll_image = name
+            else:
+                option_images[option_id] = name
+
+        if poll_image:
+            Poll.objects.filter(id=poll_id).update(image=poll_image)
+
+        options = list(
+            PollOption.objects.filter(poll_id=poll_id, id__in=option_images.keys())
+        )
+        for option in options:
+            option.image = option_images[option.id]
+        PollOption.objects.bulk_update(options, ["image"])
+
+        return {
+            "success": True,
+            "poll_id": poll_id,
+            "attached": len(options) + (1 if poll_image else 0),
+        }
+    except Exception as exc:
+        logger.error(f"Attach poll images task failed for {poll_id}: {str(exc)}")
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=60 * (2**self.request.retries), exc=exc)
+        return {"success": False, "error": str(exc)}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def moderate_poll_task(self, poll_id, image_names):
+    """
+    Async task to moderate a pending poll. Approval awards the creation aura
+    in the same transaction, so a retry re-moderates a poll whose award
+    failed, or that the moderation service couldn't evaluate. `image_names`
+    are the poll's uploads in storage.
+    """
+    try:
+        # Invalid images may already have been discarded by the attach task
+        images = [
+            _open_stored_image(name)
+            for name in image_names
+            if default_storage.exists(name)
+        ]
+        try:
+            poll = Poll.objects.select_related("profile", "community__category").get(
+                id=poll_id
+            )
+            poll = moderate_poll(poll, images)
+        finally:
+            for image in images:
+                image.close()
+
+        if poll is None:
+            return {"success": True, "poll_id": poll_id, "skipped": True}
+
+        return {"success": True, "poll_id": poll_id, "status": poll.status}
+    except Poll.DoesNotExist:
+        logger.error(f"Poll {poll_id} does not exist")
+        return {"success": False, "error": "Poll not found"}
+    except Exception as exc:
+        logger.error(f"Moderate poll task failed for {poll_id}: {str(exc)}")
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=60 * (2**self.request.retries), exc=exc)
+        return {"success": False, "error": str(exc)}
+
+
+# === CLEANUP TASKS ===
+
+
+@shared_task
+def close_expired_polls_task():
+    """Async task to close active polls whose expiry has passed"""
+    try:
+        closed_count = Poll.close_expired()
+
+        logger.info(f"Closed {closed_count} expired polls")
+        return {"success": True, "closed_count": closed_count}
+    except Exception as exc:
+        logger.error(f"Close expired polls task failed: {str(exc)}")
+        return {"success": False, "error": str(exc)}
+
+
+def _open_stored_image(name):
+    """Open a stored image as an UploadedFile for the moderation service"""
+    content_type = mimetypes.guess_type(name)[0] or "image/jpeg"
+    return UploadedFile(
+        file=default_storage.open(name),
+        name=name,
+        content_type=content_type,
+        size=default_storage.size(name),
+    )
+
+
+def _is_valid_image(name):
+    """Check that a stored file is a readable image"""
+    try:
+        with default_storage.open(name) as image_file:
+            Image.open(image_file).verify()
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,165 @@
+import json
+from datetime import date, timedelta
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from keyopolls.communities.models import Community, CommunityMembership
+from keyopolls.polls.api.streak import get_aura_transactions
+from keyopolls.polls.models import (
+    AuraTransaction,
+    CommunityStreak,
+    Poll,
+    PollOption,
+    PollVote,
+)
+from keyopolls.polls.services.streak_service import StreakService
+from keyopolls.profile.middleware import generate_pseudonymous_access_token
+from keyopolls.profile.models import PseudonymousProfile
+
+
+def create_profile(username):
+    return PseudonymousProfile.objects.create(
+        username=username,
+        display_name=username.title(),
+        email=f"{username}@example.com",
+        password_hash="x",
+    )
+
+
+class StreakSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_profile("streaker")
+        science = Community.objects.create(name="Science", creator=cls.profile)
+        history = Community.objects.create(name="History", creator=cls.profile)
+        CommunityStreak.objects.create(
+            profile=cls.profile,
+            community=science,
+            current_streak=2,
+            max_streak=5,
+            last_activity_date=date.today() - timedelta(days=1),
+        )
+        CommunityStreak.objects.create(
+            profile=cls.profile,
+            community=history,
+            current_streak=7,
+            max_streak=7,
+            last_activity_date=date.today(),
+        )
+
+    def test_summary_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            summary = StreakService.get_user_streak_summary(self.profile)
+
+        self.assertEqual(
+            [(s["community_name"], s["current_streak"]) for s in summary],
+            [("History", 7), ("Science", 2)],
+        )
+        self.assertEqual([s["is_active"] for s in summary], [True, False])
+
+
+class CastVoteTests(TestCase):
+    url = "/api/polls/general/polls/vote"
+
+    @classmethod
+    def setUpTestData(cls):
+        author = create_profile("author")
+        cls.voter = create_profile("voter")
+        community = Community.objects.create(name="Space", creator=author)
+        CommunityMembership.objects.create(
+            community=community, profile=cls.voter, role="member", status="active"
+        )
+        cls.poll = Poll.objects.create(
+            title="Which planet?",
+            community=community,
+            profile=author,
+            poll_type="single",
+            status="active",
+        )
+        cls.mars, cls.venus = PollOption.objects.bulk_create(
+            [
+                PollOption(poll=cls.poll, text="Mars", order=0),
+                PollOption(poll=cls.poll, text="Venus", order=1),
+            ]
+        )
+
+    def vote(self, option):
+        token = generate_pseudonymous_access_token(self.voter.id)
+        return self.client.post(
+            self.url,
+            json.dumps({"poll_id": self.poll.id, "votes": [{"option_id": option.id}]}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+    def test_second_ballot_is_rejected(self):
+        self.assertEqual(self.vote(self.mars).status_code, 200)
+
+        response = self.vote(self.venus)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("already voted", response.json()["message"])
+        self.assertEqual(PollVote.objects.filter(poll=self.poll).count(), 1)
+        self.poll.refresh_from_db()
+        self.assertEqual(self.poll.total_voters, 1)
+
+    def test_vote_without_answer_result_blocks_another_ballot(self):
+        # Votes cast before answer results were tracked have no result row
+        PollVote.objects.create(poll=self.poll, option=self.mars, profile=self.voter)
+
+        response = self.vote(self.venus)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(PollVote.objects.filter(poll=self.poll).count(), 1)
+
+
+class AuraTransactionsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.profile = create_profile("aura")
+        now = timezone.now()
+        # Two transactions share a timestamp, so pages have to break the tie
+        # on id
+        cls.transactions = AuraTransaction.objects.bulk_create(
+            [
+                AuraTransaction(
+                    profile=cls.profile,
+                    transaction_type="poll_participation",
+                    amount=1,
+                    created_at=now - timedelta(minutes=minutes),
+                )
+                for minutes in (0, 1, 1, 2, 3)
+            ]
+        )
+
+    def get_page(self, **params):
+        request = RequestFactory().get("/profile/aura/transactions")
+        request.auth = self.profile
+        return get_aura_transactions(request, **params)
+
+    def test_cursor_pages_through_every_transaction_once(self):
+        expected = [
+            t.id
+            for t in sorted(
+                self.transactions, key=lambda t: (t.created_at, t.id), reverse=True
+            )
+        ]
+
+        seen = []
+        cursor = None
+        while True:
+            status, page = self.get_page(limit=2, cursor=cursor)
+            self.assertEqual(status, 200)
+            seen.extend(t["id"] for t in page["transactions"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor_is_rejected(self):
+        status, body = self.get_page(cursor="not-a-cursor")
+
+        self.assertEqual(status, 400)
+        self.assertEqual(body, {"message": "Invalid cursor"})